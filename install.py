@@ -13,8 +13,23 @@ This script:
 import os
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+HOME = Path.home()
+
+
+def ensure_dir(path: Path) -> bool:
+    """Create a directory (and parents) if missing. Returns True if it was created.
+
+    A single mkdir call replaces the exists()-then-mkdir() pair.
+    """
+    try:
+        path.mkdir(parents=True)
+    except FileExistsError:
+        return False
+    return True
+
 
 def install_scripts() -> None:
     """Install the start-the-day and auto wrapper scripts."""
@@ -38,10 +53,9 @@ def install_scripts() -> None:
         sys.exit(1)
 
     # Create ~/.local/bin directory if it doesn't exist
-    local_bin_dir = Path.home() / ".local" / "bin"
-    if not local_bin_dir.exists():
-        print(f"Creating directory: {local_bin_dir}")
-        local_bin_dir.mkdir(parents=True, exist_ok=True)
+    local_bin_dir = HOME / ".local" / "bin"
+    if ensure_dir(local_bin_dir):
+        print(f"Created directory: {local_bin_dir}")
     else:
         print(f"Directory already exists: {local_bin_dir}")
 
@@ -61,9 +75,15 @@ def install_wrapper_script(venv_python: Path, target_script: Path, wrapper_path:
 exec "{venv_python}" "{target_script}" "$@"
 """
 
-    # Handle existing files
+    wrapper_bytes = wrapper_content.encode()
+
+    # Handle existing files (compare sizes first so a changed wrapper is never read)
     if wrapper_path.exists() or wrapper_path.is_symlink():
-        if wrapper_path.exists() and wrapper_path.read_text().strip() == wrapper_content.strip():
+        if (
+            wrapper_path.exists()
+            and wrapper_path.stat().st_size == len(wrapper_bytes)
+            and wrapper_path.read_bytes() == wrapper_bytes
+        ):
             print(f"Wrapper script already up-to-date: {wrapper_path}")
             return
         else:
@@ -72,17 +92,16 @@ exec "{venv_python}" "{target_script}" "$@"
 
     # Create the wrapper script
     print(f"Creating wrapper script: {wrapper_path}")
-    wrapper_path.write_text(wrapper_content)
+    wrapper_path.write_bytes(wrapper_bytes)
     wrapper_path.chmod(0o755)  # Make executable
 
 
 def install_launch_agent() -> None:
     """Install macOS LaunchAgents."""
     # Create ~/.local/log directory for LaunchAgent logs
-    local_log_dir = Path.home() / ".local" / "log"
-    if not local_log_dir.exists():
-        print(f"Creating directory: {local_log_dir}")
-        local_log_dir.mkdir(parents=True, exist_ok=True)
+    local_log_dir = HOME / ".local" / "log"
+    if ensure_dir(local_log_dir):
+        print(f"Created directory: {local_log_dir}")
     else:
         print(f"Directory already exists: {local_log_dir}")
 
@@ -95,41 +114,62 @@ def install_launch_agent() -> None:
     # List of plist templates to install
     plist_files = ["com.leosimons.start-the-day.plist", "com.leosimons.gdrive-sync.plist"]
 
-    launch_agents_dir = Path.home() / "Library" / "LaunchAgents"
-    if not launch_agents_dir.exists():
-        print(f"Creating directory: {launch_agents_dir}")
-        launch_agents_dir.mkdir(parents=True, exist_ok=True)
+    launch_agents_dir = HOME / "Library" / "LaunchAgents"
+    if ensure_dir(launch_agents_dir):
+        print(f"Created directory: {launch_agents_dir}")
+
+    # Plists are independent, so install them concurrently; each worker returns
+    # its messages so the output stays grouped per plist and in order.
+    with ThreadPoolExecutor(max_workers=len(plist_files)) as executor:
+        results = executor.map(
+            _install_one_plist,
+            [script_dir / "etc" / plist_file for plist_file in plist_files],
+            [launch_agents_dir / plist_file for plist_file in plist_files],
+            [username] * len(plist_files),
+        )
+        for messages in results:
+            for message in messages:
+                print(message)
 
-    for plist_file in plist_files:
-        plist_template_path = script_dir / "etc" / plist_file
 
-        if not plist_template_path.exists():
-            print(f"Error: {plist_template_path} not found")
-            continue
+def _install_one_plist(template_path: Path, dest_path: Path, username: str) -> list[str]:
+    """Customize, write and load a single LaunchAgent plist. Returns output lines."""
+    if not template_path.exists():
+        return [f"Error: {template_path} not found"]
 
-        # Read plist template and replace username
-        plist_content = plist_template_path.read_text()
-        plist_content = plist_content.replace("/Users/lsimons/", f"/Users/{username}/")
+    # Read plist template and replace username (as bytes: no decode/encode round-trip)
+    plist_content = template_path.read_bytes()
+    plist_content = plist_content.replace(b"/Users/lsimons/", f"/Users/{username}/".encode())
 
-        plist_dest_path = launch_agents_dir / plist_file
+    # Write the customized plist
+    messages = [f"Installing LaunchAgent: {dest_path}"]
+    dest_path.write_bytes(plist_content)
 
-        # Write the customized plist
-        print(f"Installing LaunchAgent: {plist_dest_path}")
-        plist_dest_path.write_text(plist_content)
+    # Load the LaunchAgent
+    messages.append(f"Loading LaunchAgent {dest_path.name}...")
+    if load_launch_agent(dest_path):
+        messages.append(f"LaunchAgent {dest_path.name} loaded successfully!")
+    else:
+        messages.append(f"Warning: Failed to load LaunchAgent {dest_path.name}.")
+    return messages
 
-        # Load the LaunchAgent
-        print(f"Loading LaunchAgent {plist_file}...")
-        # Unload first to ensure reload works if it changed
-        subprocess.run(
-            ["launchctl", "unload", str(plist_dest_path)],
-            stderr=subprocess.DEVNULL,
-            check=False,
-        )
-        result = subprocess.run(["launchctl", "load", str(plist_dest_path)], check=False)
-        if result.returncode == 0:
-            print(f"LaunchAgent {plist_file} loaded successfully!")
-        else:
-            print(f"Warning: Failed to load LaunchAgent {plist_file}.")
+
+def load_launch_agent(plist_path: Path) -> bool:
+    """(Re)load a LaunchAgent plist. Returns True if launchctl load succeeded.
+
+    launchctl is exec'd directly (no shell). The legacy unload/load pair is kept
+    rather than bootout/bootstrap: bootout returns before the job is fully torn
+    down, so an immediate bootstrap can fail with "Input/output error".
+    """
+    # Unload first to ensure reload works if it changed
+    subprocess.run(
+        ["launchctl", "unload", str(plist_path)],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        check=False,
+    )
+    result = subprocess.run(["launchctl", "load", str(plist_path)], check=False)
+    return result.returncode == 0
 
 
 def print_tcc_instructions() -> None:
@@ -9,22 +9,10 @@ This module is a thin wrapper that delegates to the agent_manager_impl package.
 All implementation is in lsimons_auto/actions/agent_manager_impl/.
 """
 
-# Handle both package import and direct script execution
-try:
-    # Package import (when imported as lsimons_auto.actions.agent_manager)
-    from .agent_manager_impl import (
-        GIT_ROOT,
-        SESSIONS_DIR,
-        AgentPane,
-        AgentSession,
-        create_parser,
-        discover_workspaces,
-        find_pane_by_target,
-        fuzzy_match_workspace,
-        get_most_recent_session,
-        list_sessions,
-        main,
-    )
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
     from .agent_manager_impl.cli import (
         cmd_attach,
         cmd_broadcast,
@@ -34,58 +22,22 @@ try:
         cmd_list,
         cmd_send,
         cmd_spawn,
+        create_parser,
+        main,
     )
-    from .agent_manager_impl.layout import create_layout, start_agents_in_panes
-    from .agent_manager_impl.tmux import (
-        attach_session,
-        create_session,
-        focus_pane_direction,
-        kill_pane,
-        kill_session,
-        run_tmux,
-        select_pane,
-        send_keys,
-        session_exists,
-        split_pane_horizontal,
-        split_pane_vertical,
-    )
-    from .agent_manager_impl.worktree import (
-        ensure_worktree,
-        ensure_worktrees_dir,
-        get_worktree_branch,
-        list_worktrees,
-        remove_worktree,
+    from .agent_manager_impl.layout import (
+        create_layout,
+        start_agents_in_panes,
     )
-except ImportError:
-    # Direct script execution (when run as `python agent_manager.py`)
-    from agent_manager_impl import (  # pyright: ignore[reportMissingImports]
-        GIT_ROOT,
+    from .agent_manager_impl.session import (
         SESSIONS_DIR,
         AgentPane,
         AgentSession,
-        create_parser,
-        discover_workspaces,
         find_pane_by_target,
-        fuzzy_match_workspace,
         get_most_recent_session,
         list_sessions,
-        main,
-    )
-    from agent_manager_impl.cli import (  # pyright: ignore[reportMissingImports]
-        cmd_attach,
-        cmd_broadcast,
-        cmd_close,
-        cmd_focus,
-        cmd_kill,
-        cmd_list,
-        cmd_send,
-        cmd_spawn,
     )
-    from agent_manager_impl.layout import (  # pyright: ignore[reportMissingImports]
-        create_layout,
-        start_agents_in_panes,
-    )
-    from agent_manager_impl.tmux import (  # pyright: ignore[reportMissingImports]
+    from .agent_manager_impl.tmux import (
         attach_session,
         create_session,
         focus_pane_direction,
@@ -98,7 +50,12 @@ except ImportError:
         split_pane_horizontal,
         split_pane_vertical,
     )
-    from agent_manager_impl.worktree import (  # pyright: ignore[reportMissingImports]
+    from .agent_manager_impl.workspace import (
+        GIT_ROOT,
+        discover_workspaces,
+        fuzzy_match_workspace,
+    )
+    from .agent_manager_impl.worktree import (
         ensure_worktree,
         ensure_worktrees_dir,
         get_worktree_branch,
@@ -106,6 +63,59 @@ except ImportError:
         remove_worktree,
     )
 
+# Exported name -> agent_manager_impl submodule. Submodules are imported on first
+# attribute access (PEP 562), so importing this module stays cheap.
+_LAZY: dict[str, str] = {
+    "main": "cli",
+    "create_parser": "cli",
+    "cmd_attach": "cli",
+    "cmd_broadcast": "cli",
+    "cmd_close": "cli",
+    "cmd_focus": "cli",
+    "cmd_kill": "cli",
+    "cmd_list": "cli",
+    "cmd_send": "cli",
+    "cmd_spawn": "cli",
+    "SESSIONS_DIR": "session",
+    "AgentPane": "session",
+    "AgentSession": "session",
+    "find_pane_by_target": "session",
+    "get_most_recent_session": "session",
+    "list_sessions": "session",
+    "GIT_ROOT": "workspace",
+    "discover_workspaces": "workspace",
+    "fuzzy_match_workspace": "workspace",
+    "ensure_worktree": "worktree",
+    "ensure_worktrees_dir": "worktree",
+    "get_worktree_branch": "worktree",
+    "list_worktrees": "worktree",
+    "remove_worktree": "worktree",
+    "attach_session": "tmux",
+    "create_session": "tmux",
+    "focus_pane_direction": "tmux",
+    "kill_pane": "tmux",
+    "kill_session": "tmux",
+    "run_tmux": "tmux",
+    "select_pane": "tmux",
+    "send_keys": "tmux",
+    "session_exists": "tmux",
+    "split_pane_horizontal": "tmux",
+    "split_pane_vertical": "tmux",
+    "create_layout": "layout",
+    "start_agents_in_panes": "layout",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".agent_manager_impl.{module_name}", __package__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
 __all__ = [
     # Main entry point
     "main",
@@ -156,4 +166,9 @@ __all__ = [
 ]
 
 if __name__ == "__main__":
-    main()
+    # Direct script execution (when run as `python agent_manager.py`)
+    from agent_manager_impl.cli import (  # pyright: ignore[reportMissingImports]
+        main as _main,  # pyright: ignore[reportUnknownVariableType]
+    )
+
+    _main()
@@ -4,17 +4,51 @@ agent_manager_impl - Implementation package for the agent-manager action.
 This package provides multi-agent Claude Code session management using tmux.
 """
 
-from .cli import create_parser, main
-from .session import (
-    SESSIONS_DIR,
-    AgentPane,
-    AgentSession,
-    find_pane_by_target,
-    get_most_recent_session,
-    list_sessions,
-)
-from .workspace import GIT_ROOT, discover_workspaces, fuzzy_match_workspace
-from .worktree import ensure_worktree, ensure_worktrees_dir
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .cli import create_parser, main
+    from .session import (
+        SESSIONS_DIR,
+        AgentPane,
+        AgentSession,
+        find_pane_by_target,
+        get_most_recent_session,
+        list_sessions,
+    )
+    from .workspace import GIT_ROOT, discover_workspaces, fuzzy_match_workspace
+    from .worktree import ensure_worktree, ensure_worktrees_dir
+
+# Exported name -> submodule. Importing a submodule (e.g. .cli) runs this
+# __init__ first, so re-exports are resolved lazily (PEP 562) rather than
+# pulling in every submodule up front.
+_LAZY: dict[str, str] = {
+    "main": "cli",
+    "create_parser": "cli",
+    "SESSIONS_DIR": "session",
+    "AgentPane": "session",
+    "AgentSession": "session",
+    "find_pane_by_target": "session",
+    "get_most_recent_session": "session",
+    "list_sessions": "session",
+    "GIT_ROOT": "workspace",
+    "discover_workspaces": "workspace",
+    "fuzzy_match_workspace": "workspace",
+    "ensure_worktree": "worktree",
+    "ensure_worktrees_dir": "worktree",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{module_name}", __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     # Main entry point
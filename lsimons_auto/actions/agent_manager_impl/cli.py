@@ -5,27 +5,32 @@ Defines the CLI interface for the agent action.
 """
 
 import argparse
+import functools
 import subprocess
 import sys
-from datetime import UTC, datetime
+import time
+from collections.abc import Callable
+from typing import NamedTuple
 
-from .layout import create_layout, start_agents_in_panes
 from .session import (
     AgentSession,
     find_pane_by_target,
     get_most_recent_session,
+    list_session_summaries,
     list_sessions,
 )
 from .tmux import (
+    PANE_DIRECTIONS,
     attach_session,
     focus_pane_direction,
     kill_pane,
     kill_session,
+    list_tmux_sessions,
     select_pane,
     send_keys,
+    send_keys_multi,
     session_exists,
 )
-from .workspace import discover_workspaces, fuzzy_match_workspace
 
 # =============================================================================
 # Subcommand Handlers
@@ -34,6 +39,11 @@ from .workspace import discover_workspaces, fuzzy_match_workspace
 
 def cmd_spawn(args: argparse.Namespace) -> None:
     """Create new agent layout."""
+    # Only spawn needs workspace discovery and layout/worktree setup; importing
+    # them here keeps the other subcommands' startup light.
+    from .layout import create_layout, start_agents_in_panes
+    from .workspace import discover_workspaces, fuzzy_match_workspace
+
     # Workspace selection
     if args.org and args.repo:
         workspaces = discover_workspaces()
@@ -47,15 +57,13 @@ def cmd_spawn(args: argparse.Namespace) -> None:
     print(f"Workspace: {org}/{repo} ({workspace_path})")
 
     # Generate session ID and tmux session name
-    timestamp = datetime.now(UTC).strftime("%Y%m%d-%H%M%S")
+    now = time.gmtime()
+    timestamp = time.strftime("%Y%m%d-%H%M%S", now)
     session_id = f"auto-agent-{timestamp}"
     tmux_session_name = session_id  # Use same name for tmux session
 
-    # Create layout (this also creates worktrees and tmux session)
-    print(f"Creating layout with {args.subagents} subagent(s)...")
-    panes = create_layout(args.subagents, workspace_path, args.command, repo, tmux_session_name)
-
-    # Launch Zed if requested (opens original repo, not worktrees)
+    # Launch Zed first (opens original repo, not worktrees) so its startup
+    # overlaps with worktree and tmux setup; Popen doesn't wait for it
     if not args.no_zed:
         print("Launching Zed editor...")
         try:
@@ -67,6 +75,10 @@ def cmd_spawn(args: argparse.Namespace) -> None:
         except FileNotFoundError:
             print("Warning: Zed not found, skipping editor launch")
 
+    # Create layout (this also creates worktrees and tmux session)
+    print(f"Creating layout with {args.subagents} subagent(s)...")
+    panes = create_layout(args.subagents, workspace_path, args.command, repo, tmux_session_name)
+
     # Start agents in panes
     print("Starting agents...")
     start_agents_in_panes(panes)
@@ -77,7 +89,7 @@ def cmd_spawn(args: argparse.Namespace) -> None:
         workspace_path=str(workspace_path),
         repo_name=repo,
         org_name=org,
-        created_at=datetime.now(UTC).isoformat(),
+        created_at=time.strftime("%Y-%m-%dT%H:%M:%S+00:00", now),
         panes=panes,
         tmux_session_name=tmux_session_name,
     )
@@ -155,11 +167,11 @@ def cmd_broadcast(args: argparse.Namespace) -> None:
     if args.exclude_main:
         target_panes = [p for p in target_panes if not p.is_main]
 
-    # Send to each pane
-    for pane in target_panes:
-        if pane.tmux_pane_id:
-            send_keys(pane.tmux_pane_id, text, enter=True)
-            print(f"Sent to {pane.id}")
+    # Send to every pane in one tmux call
+    sent = [(p.id, p.tmux_pane_id) for p in target_panes if p.tmux_pane_id]
+    send_keys_multi([pane_id for _, pane_id in sent], text, enter=True)
+    for name, _ in sent:
+        print(f"Sent to {name}")
 
     print(f"Broadcast complete: {text}")
 
@@ -181,8 +193,9 @@ def cmd_focus(args: argparse.Namespace) -> None:
         sys.exit(1)
 
     # Check if it's a direction
-    if args.target.lower() in ("left", "right", "up", "down"):
-        focus_pane_direction(session.tmux_session_name, args.target.lower())
+    direction = args.target.lower()
+    if direction in PANE_DIRECTIONS:
+        focus_pane_direction(session.tmux_session_name, direction)
         print(f"Focused {args.target}")
         return
 
@@ -204,35 +217,53 @@ def cmd_focus(args: argparse.Namespace) -> None:
 
 def cmd_list(args: argparse.Namespace) -> None:
     """List active sessions."""
+    if not args.verbose:
+        # One-line summaries come from the session index; no session files are parsed
+        summaries = list_session_summaries()
+        if not summaries:
+            print("No active sessions")
+            return
+
+        active = list_tmux_sessions()
+        lines: list[str] = []
+        for summary in summaries:
+            tmux_active = summary.tmux_session_name in active
+            status = "" if tmux_active else " (tmux session gone)"
+            lines.append(
+                f"{summary.session_id}: {summary.org_name}/{summary.repo_name} "
+                f"({summary.pane_count} panes){status}"
+            )
+        print("\n".join(lines))
+        return
+
     sessions = list_sessions()
 
     if not sessions:
         print("No active sessions")
         return
 
+    # Collect all output and print it once rather than once per line
+    active = list_tmux_sessions()
+    lines = []
     for session in sessions:
         # Check if tmux session still exists
-        tmux_active = session.tmux_session_name and session_exists(session.tmux_session_name)
+        tmux_active = session.tmux_session_name in active
         status = "" if tmux_active else " (tmux session gone)"
 
-        if args.verbose:
-            print(f"\nSession: {session.session_id}{status}")
-            print(f"  Workspace: {session.org_name}/{session.repo_name}")
-            print(f"  Path: {session.workspace_path}")
-            print(f"  Created: {session.created_at}")
-            print(f"  tmux session: {session.tmux_session_name}")
-            print(f"  Panes: {len(session.panes)}")
-            for pane in session.panes:
-                main_marker = " (main)" if pane.is_main else ""
-                worktree_info = f" @ {pane.worktree_path}" if pane.worktree_path else ""
-                pane_id_info = f" [{pane.tmux_pane_id}]" if pane.tmux_pane_id else ""
-                print(f"    - {pane.id}: {pane.command}{main_marker}{pane_id_info}{worktree_info}")
-        else:
-            pane_count = len(session.panes)
-            print(
-                f"{session.session_id}: {session.org_name}/{session.repo_name} "
-                f"({pane_count} panes){status}"
+        lines.append(f"\nSession: {session.session_id}{status}")
+        lines.append(f"  Workspace: {session.org_name}/{session.repo_name}")
+        lines.append(f"  Path: {session.workspace_path}")
+        lines.append(f"  Created: {session.created_at}")
+        lines.append(f"  tmux session: {session.tmux_session_name}")
+        lines.append(f"  Panes: {len(session.panes)}")
+        for pane in session.panes:
+            main_marker = " (main)" if pane.is_main else ""
+            worktree_info = f" @ {pane.worktree_path}" if pane.worktree_path else ""
+            pane_id_info = f" [{pane.tmux_pane_id}]" if pane.tmux_pane_id else ""
+            lines.append(
+                f"    - {pane.id}: {pane.command}{main_marker}{pane_id_info}{worktree_info}"
             )
+    print("\n".join(lines))
 
 
 def cmd_close(args: argparse.Namespace) -> None:
@@ -289,8 +320,12 @@ def cmd_kill(args: argparse.Namespace) -> None:
             sys.exit(1)
 
     if not args.force:
+        # Nobody can answer the prompt when stdin is piped or closed
+        if not sys.stdin.isatty():
+            print("Error: Refusing to kill without --force in non-interactive mode")
+            sys.exit(1)
         print(f"Kill session {session.session_id}? [y/N] ", end="", flush=True)
-        response = input().strip().lower()
+        response = sys.stdin.readline().strip().lower()
         if response != "y":
             print("Cancelled")
             return
@@ -336,20 +371,10 @@ def cmd_attach(args: argparse.Namespace) -> None:
 # =============================================================================
 
 
-def create_parser() -> argparse.ArgumentParser:
-    """Create argument parser with subcommands."""
-    parser = argparse.ArgumentParser(
-        prog="auto agent",
-        description="Manage Claude Code agent sessions in tmux",
-    )
-
-    subparsers = parser.add_subparsers(dest="subcommand", required=True)
-
-    # spawn subcommand
-    spawn_parser = subparsers.add_parser("spawn", help="Create new agent layout")
-    spawn_parser.add_argument("org", nargs="?", help="Organization (fuzzy match)")
-    spawn_parser.add_argument("repo", nargs="?", help="Repository (fuzzy match)")
-    spawn_parser.add_argument(
+def _add_spawn_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("org", nargs="?", help="Organization (fuzzy match)")
+    parser.add_argument("repo", nargs="?", help="Repository (fuzzy match)")
+    parser.add_argument(
         "--subagents",
         "-n",
         type=int,
@@ -357,71 +382,145 @@ def create_parser() -> argparse.ArgumentParser:
         choices=[1, 2, 3, 4],
         help="Number of subagent panes (default: 1)",
     )
-    spawn_parser.add_argument(
+    parser.add_argument(
         "--command",
         "-c",
         default="claude",
         help="Agent command to run (default: claude)",
     )
-    spawn_parser.add_argument(
+    parser.add_argument(
         "--no-zed",
         action="store_true",
         help="Skip launching Zed editor",
     )
-    spawn_parser.add_argument(
+    parser.add_argument(
         "--no-attach",
         action="store_true",
         help="Don't attach to tmux session after creation",
     )
 
-    # attach subcommand
-    attach_parser = subparsers.add_parser("attach", help="Attach to existing session")
-    attach_parser.add_argument("session", nargs="?", help="Session ID (default: most recent)")
-
-    # send subcommand
-    send_parser = subparsers.add_parser("send", help="Send text to specific agent")
-    send_parser.add_argument("target", help="Agent ID, pane index, or 'main'")
-    send_parser.add_argument("text", nargs="+", help="Text to send")
-    send_parser.add_argument("--session", "-s", help="Session ID (default: most recent)")
-
-    # broadcast subcommand
-    broadcast_parser = subparsers.add_parser("broadcast", help="Send text to all agents")
-    broadcast_parser.add_argument("text", nargs="+", help="Text to broadcast")
-    broadcast_parser.add_argument("--session", "-s", help="Session ID (default: most recent)")
-    broadcast_parser.add_argument(
+
+def _add_attach_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("session", nargs="?", help="Session ID (default: most recent)")
+
+
+def _add_send_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("target", help="Agent ID, pane index, or 'main'")
+    parser.add_argument("text", nargs="+", help="Text to send")
+    parser.add_argument("--session", "-s", help="Session ID (default: most recent)")
+
+
+def _add_broadcast_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("text", nargs="+", help="Text to broadcast")
+    parser.add_argument("--session", "-s", help="Session ID (default: most recent)")
+    parser.add_argument(
         "--exclude-main",
         action="store_true",
         help="Exclude main agent from broadcast",
     )
 
-    # focus subcommand
-    focus_parser = subparsers.add_parser("focus", help="Focus agent pane")
-    focus_parser.add_argument(
-        "target", help="Agent ID, pane index, or direction (left/right/up/down)"
-    )
-    focus_parser.add_argument("--session", "-s", help="Session ID (default: most recent)")
 
-    # list subcommand
-    list_parser = subparsers.add_parser("list", help="List active sessions")
-    list_parser.add_argument(
-        "--verbose", "-v", action="store_true", help="Show detailed session info"
-    )
+def _add_focus_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("target", help="Agent ID, pane index, or direction (left/right/up/down)")
+    parser.add_argument("--session", "-s", help="Session ID (default: most recent)")
+
+
+def _add_list_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--verbose", "-v", action="store_true", help="Show detailed session info")
 
-    # close subcommand
-    close_parser = subparsers.add_parser("close", help="Close specific agent pane")
-    close_parser.add_argument("target", help="Agent ID or pane index")
-    close_parser.add_argument("--session", "-s", help="Session ID (default: most recent)")
 
-    # kill subcommand
-    kill_parser = subparsers.add_parser("kill", help="Terminate session and close window")
-    kill_parser.add_argument("session", nargs="?", help="Session ID (default: most recent)")
-    kill_parser.add_argument(
+def _add_close_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("target", help="Agent ID or pane index")
+    parser.add_argument("--session", "-s", help="Session ID (default: most recent)")
+
+
+def _add_kill_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("session", nargs="?", help="Session ID (default: most recent)")
+    parser.add_argument(
         "--force", "-f", action="store_true", help="Force kill without confirmation"
     )
 
+
+class Subcommand(NamedTuple):
+    """A CLI subcommand: help text, argument setup and handler."""
+
+    help: str
+    add_args: Callable[[argparse.ArgumentParser], None]
+    handler: Callable[[argparse.Namespace], None]
+
+
+# Subcommand name -> definition, in help order; main() dispatches through it
+SUBCOMMANDS: dict[str, Subcommand] = {
+    "spawn": Subcommand("Create new agent layout", _add_spawn_args, cmd_spawn),
+    "attach": Subcommand("Attach to existing session", _add_attach_args, cmd_attach),
+    "send": Subcommand("Send text to specific agent", _add_send_args, cmd_send),
+    "broadcast": Subcommand("Send text to all agents", _add_broadcast_args, cmd_broadcast),
+    "focus": Subcommand("Focus agent pane", _add_focus_args, cmd_focus),
+    "list": Subcommand("List active sessions", _add_list_args, cmd_list),
+    "close": Subcommand("Close specific agent pane", _add_close_args, cmd_close),
+    "kill": Subcommand("Terminate session and close window", _add_kill_args, cmd_kill),
+}
+
+
+@functools.lru_cache(maxsize=len(SUBCOMMANDS) + 1)
+def create_parser(subcommand: str | None = None) -> argparse.ArgumentParser:
+    """Create argument parser with subcommands.
+
+    With a subcommand name, only that subcommand's arguments are added; the
+    others are registered bare so usage and help still list them. Parsers
+    are cached, and ``parse_args`` returns a fresh Namespace on every call,
+    so sharing them is safe.
+    """
+    parser = argparse.ArgumentParser(
+        prog="auto agent",
+        description="Manage Claude Code agent sessions in tmux",
+    )
+
+    subparsers = parser.add_subparsers(dest="subcommand", required=True)
+    for name, definition in SUBCOMMANDS.items():
+        sub = subparsers.add_parser(name, help=definition.help)
+        if subcommand is None or name == subcommand:
+            definition.add_args(sub)
+
     return parser
 
 
+def _fast_parse(argv: list[str]) -> argparse.Namespace | None:
+    """
+    Parse the simplest forms of the frequently scripted subcommands by hand.
+
+    Handles `send TARGET TEXT...`, `broadcast TEXT...`, `focus TARGET` and
+    `list`, each with an optional trailing `-s/--session SESSION`. Returns
+    None for anything else (other flags, help, errors) so argparse handles it
+    with its usual validation and messages.
+    """
+    if not argv:
+        return None
+    subcommand, tokens = argv[0], argv[1:]
+    session = None
+    if len(tokens) >= 2 and tokens[-2] in ("-s", "--session") and subcommand != "list":
+        session = tokens[-1]
+        tokens = tokens[:-2]
+        if session.startswith("-"):
+            return None
+    if any(token.startswith("-") for token in tokens):
+        return None
+
+    if subcommand == "send" and len(tokens) >= 2:
+        return argparse.Namespace(
+            subcommand=subcommand, target=tokens[0], text=tokens[1:], session=session
+        )
+    if subcommand == "broadcast" and tokens:
+        return argparse.Namespace(
+            subcommand=subcommand, text=tokens, session=session, exclude_main=False
+        )
+    if subcommand == "focus" and len(tokens) == 1:
+        return argparse.Namespace(subcommand=subcommand, target=tokens[0], session=session)
+    if subcommand == "list" and not tokens:
+        return argparse.Namespace(subcommand=subcommand, verbose=False)
+    return None
+
+
 # =============================================================================
 # Main Entry Point
 # =============================================================================
@@ -429,26 +528,15 @@ def create_parser() -> argparse.ArgumentParser:
 
 def main(args: list[str] | None = None) -> None:
     """Main entry point for agent action."""
-    parser = create_parser()
-    parsed_args = parser.parse_args(args)
+    argv = sys.argv[1:] if args is None else args
+    parsed_args = _fast_parse(argv)
+    if parsed_args is None:
+        # Only build the arguments of the subcommand being run
+        selected = argv[0] if argv and argv[0] in SUBCOMMANDS else None
+        parsed_args = create_parser(selected).parse_args(argv)
 
     try:
-        if parsed_args.subcommand == "spawn":
-            cmd_spawn(parsed_args)
-        elif parsed_args.subcommand == "attach":
-            cmd_attach(parsed_args)
-        elif parsed_args.subcommand == "send":
-            cmd_send(parsed_args)
-        elif parsed_args.subcommand == "broadcast":
-            cmd_broadcast(parsed_args)
-        elif parsed_args.subcommand == "focus":
-            cmd_focus(parsed_args)
-        elif parsed_args.subcommand == "list":
-            cmd_list(parsed_args)
-        elif parsed_args.subcommand == "close":
-            cmd_close(parsed_args)
-        elif parsed_args.subcommand == "kill":
-            cmd_kill(parsed_args)
+        SUBCOMMANDS[parsed_args.subcommand].handler(parsed_args)
     except FileNotFoundError as e:
         print(f"Error: {e}")
         sys.exit(1)
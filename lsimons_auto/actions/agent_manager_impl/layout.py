@@ -5,16 +5,76 @@ Creates multi-pane tmux layouts with git worktrees for isolated agent sessions.
 """
 
 from pathlib import Path
+from typing import NamedTuple
 
 from .session import AgentPane
-from .tmux import (
-    create_session,
-    select_pane,
-    send_keys,
-    split_pane_horizontal,
-    split_pane_vertical,
-)
-from .worktree import ensure_worktree, ensure_worktrees_dir
+from .tmux import run_tmux_script, send_keys_multi
+from .worktree import ensure_worktrees, ensure_worktrees_dir
+
+
+class LayoutStep(NamedTuple):
+    """One split in a layout: create pane `name` by splitting pane `target`."""
+
+    name: str  # pane and worktree name, e.g. "001"
+    split: str  # "h" (side by side) or "v" (stacked)
+    target: str  # name of the pane to split, e.g. "M"
+    size: str | None = None  # new pane size for tmux -l, e.g. "67%"
+
+
+# Number of subagents -> splits creating them, in order. Pane indexes follow
+# the names ("M" = 0, "001" = 1, ...), not the split order.
+LAYOUT_RECIPES: dict[int, tuple[LayoutStep, ...]] = {
+    0: (),
+    # main | s1
+    1: (LayoutStep("001", "h", "M"),),
+    # main | s1/s2
+    2: (LayoutStep("001", "h", "M"), LayoutStep("002", "v", "001")),
+    # main | s1/s2/s3
+    3: (
+        LayoutStep("001", "h", "M"),
+        LayoutStep("002", "v", "001"),
+        LayoutStep("003", "v", "002"),
+    ),
+    # main | s1/s2 | s3/s4, in thirds
+    4: (
+        LayoutStep("001", "h", "M", "67%"),
+        LayoutStep("003", "h", "001", "50%"),
+        LayoutStep("002", "v", "001"),
+        LayoutStep("004", "v", "003"),
+    ),
+}
+
+
+def layout_script(
+    recipe: tuple[LayoutStep, ...], tmux_session_name: str, worktrees: dict[str, Path]
+) -> list[list[str]]:
+    """
+    Render a layout recipe as tmux commands for run_tmux_script.
+
+    Pane ids aren't known until the commands run, so splits target panes by
+    position instead: a split makes the new pane active, so a step can split
+    the active pane (the one created last) or `{last}` (the one before it).
+    Each command prints its new pane id, in recipe order.
+    """
+    session = tmux_session_name
+    print_id = ["-P", "-F", "#{pane_id}"]
+    commands = [["new-session", "-d", "-s", session, "-c", str(worktrees["M"]), *print_id]]
+    active, last = "M", "M"
+    for step in recipe:
+        if step.target == active:
+            target = session
+        elif step.target == last:
+            target = f"{session}:.{{last}}"
+        else:
+            raise ValueError(f"Layout step {step.name} splits {step.target}, which isn't reachable")
+        command = ["split-window", f"-{step.split}", "-t", target, "-c", str(worktrees[step.name])]
+        if step.size:
+            command.extend(["-l", step.size])
+        commands.append([*command, *print_id])
+        active, last = step.name, active
+    # Focus back to the main pane, which every recipe keeps at the top left
+    commands.append(["select-pane", "-t", f"{session}:.{{top-left}}"])
+    return commands
 
 
 def create_layout(
@@ -41,122 +101,47 @@ def create_layout(
     Returns:
         List of AgentPane objects with worktree paths and tmux pane IDs
     """
-    panes: list[AgentPane] = []
+    recipe = LAYOUT_RECIPES[num_subagents]
+    names = ["M", *sorted(step.name for step in recipe)]
 
-    # Create worktrees directory
+    # Create worktrees directory and all worktrees up front, in parallel
     worktrees_dir = ensure_worktrees_dir(workspace_path)
-
-    # Create worktree for main pane
-    main_worktree = ensure_worktree(workspace_path, "M", worktrees_dir)
-
-    # Create tmux session with main pane
-    main_pane_id = create_session(tmux_session_name, main_worktree)
-
-    # Main pane
-    main_pane = AgentPane(
-        id=f"M-{repo_name}",
-        pane_index=0,
-        command=command,
-        is_main=True,
-        worktree_path=str(main_worktree),
-        tmux_pane_id=main_pane_id,
-    )
-    panes.append(main_pane)
-
-    if num_subagents >= 1:
-        # Create worktree for first subagent
-        worktree_001 = ensure_worktree(workspace_path, "001", worktrees_dir)
-
-        # Split right for first subagent (horizontal split from main)
-        pane_001_id = split_pane_horizontal(main_pane_id, worktree_001)
-        panes.append(
-            AgentPane(
-                id=f"001-{repo_name}",
-                pane_index=1,
-                command=command,
-                is_main=False,
-                worktree_path=str(worktree_001),
-                tmux_pane_id=pane_001_id,
-            )
-        )
-
-    if num_subagents >= 2:
-        # Create worktree for second subagent
-        worktree_002 = ensure_worktree(workspace_path, "002", worktrees_dir)
-
-        # Split down from pane 001 (vertical split)
-        pane_002_id = split_pane_vertical(panes[1].tmux_pane_id, worktree_002)  # type: ignore[arg-type]
-        panes.append(
-            AgentPane(
-                id=f"002-{repo_name}",
-                pane_index=2,
-                command=command,
-                is_main=False,
-                worktree_path=str(worktree_002),
-                tmux_pane_id=pane_002_id,
-            )
-        )
-
-    if num_subagents >= 3:
-        # Create worktree for third subagent
-        worktree_003 = ensure_worktree(workspace_path, "003", worktrees_dir)
-
-        # Split down from pane 002 (vertical split)
-        pane_003_id = split_pane_vertical(panes[2].tmux_pane_id, worktree_003)  # type: ignore[arg-type]
-        panes.append(
-            AgentPane(
-                id=f"003-{repo_name}",
-                pane_index=3,
-                command=command,
-                is_main=False,
-                worktree_path=str(worktree_003),
-                tmux_pane_id=pane_003_id,
-            )
-        )
-
-    if num_subagents >= 4:
-        # Create worktrees for panes 3 and 4
-        worktree_003 = worktrees_dir / "003"
-        worktree_004 = ensure_worktree(workspace_path, "004", worktrees_dir)
-
-        # For 4 subagents: main | s1/s2 | s3/s4
-        # Split pane 001 horizontally to create right column
-        pane_003_id = split_pane_horizontal(panes[1].tmux_pane_id, worktree_003)  # type: ignore[arg-type]
-        # Re-assign pane 3 with correct tmux pane ID
-        panes[3] = AgentPane(
-            id=f"003-{repo_name}",
-            pane_index=3,
+    worktrees = ensure_worktrees(workspace_path, names, worktrees_dir)
+
+    # Create the session, split it and focus the main pane in one tmux call
+    output = run_tmux_script(layout_script(recipe, tmux_session_name, worktrees))
+    created = ["M", *(step.name for step in recipe)]
+    new_ids = output.split("\n")
+    if len(new_ids) != len(created):
+        raise RuntimeError(f"Unexpected tmux output creating layout: {output!r}")
+    pane_ids = dict(zip(created, new_ids, strict=True))
+
+    return [
+        AgentPane(
+            id=f"{name}-{repo_name}",
+            pane_index=i,
             command=command,
-            is_main=False,
-            worktree_path=str(worktree_003),
-            tmux_pane_id=pane_003_id,
-        )
-        # Split pane 003 vertically for pane 004
-        pane_004_id = split_pane_vertical(pane_003_id, worktree_004)
-        panes.append(
-            AgentPane(
-                id=f"004-{repo_name}",
-                pane_index=4,
-                command=command,
-                is_main=False,
-                worktree_path=str(worktree_004),
-                tmux_pane_id=pane_004_id,
-            )
+            is_main=name == "M",
+            worktree_path=str(worktrees[name]),
+            tmux_pane_id=pane_ids[name],
         )
-
-    # Focus back to main pane
-    select_pane(main_pane_id)
-
-    return panes
+        for i, name in enumerate(names)
+    ]
 
 
 def start_agents_in_panes(panes: list[AgentPane]) -> None:
     """
     Start the agent command in each pane using tmux send-keys.
 
+    Panes running the same command (normally all of them) are started with
+    a single tmux invocation.
+
     Args:
         panes: List of AgentPane objects with tmux_pane_id set
     """
+    by_command: dict[str, list[str]] = {}
     for pane in panes:
         if pane.tmux_pane_id:
-            send_keys(pane.tmux_pane_id, pane.command, enter=True)
+            by_command.setdefault(pane.command, []).append(pane.tmux_pane_id)
+    for command, pane_ids in by_command.items():
+        send_keys_multi(pane_ids, command, enter=True)
@@ -4,13 +4,38 @@ session.py - Data classes for agent session management.
 Defines AgentPane and AgentSession for tracking multi-agent Ghostty layouts.
 """
 
+import contextlib
+import fcntl
 import json
-from dataclasses import asdict, dataclass, field
+import os
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any, NamedTuple
 
 # Constants
 SESSIONS_DIR = Path.home() / ".config" / "auto" / "agent" / "sessions"
 
+# Sidecar summary of all sessions, so listing doesn't parse every session file.
+# Names starting with "_" are never session files.
+INDEX_FILE = "_index.json"
+# Lock file serializing writes to session files and the index
+SESSIONS_LOCK_FILE = "_sessions.lock"
+SESSIONS_LOCK_TIMEOUT = 5.0  # seconds
+
+# The sessions directory already created by this process, if any
+_sessions_dir_ready: Path | None = None
+
+
+def _ensure_sessions_dir(force: bool = False) -> Path:
+    """Create SESSIONS_DIR once per process instead of on every save."""
+    global _sessions_dir_ready
+    if force or _sessions_dir_ready != SESSIONS_DIR:
+        SESSIONS_DIR.mkdir(parents=True, exist_ok=True)
+        _sessions_dir_ready = SESSIONS_DIR
+    return SESSIONS_DIR
+
 
 @dataclass
 class AgentPane:
@@ -40,37 +65,238 @@ class AgentSession:
     @classmethod
     def load(cls, session_id: str) -> AgentSession:
         """Load session from disk."""
-        session_file = SESSIONS_DIR / f"{session_id}.json"
-        if not session_file.exists():
-            raise FileNotFoundError(f"Session not found: {session_id}")
-        with open(session_file) as f:
-            data = json.load(f)
+        try:
+            data = _read_session_data(session_id)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Session not found: {session_id}") from None
         panes = [AgentPane(**p) for p in data.pop("panes", [])]
         return cls(**data, panes=panes)
 
+    def to_dict(self) -> dict[str, Any]:
+        """Build the JSON payload directly, skipping asdict's recursive deep copy."""
+        return {
+            "session_id": self.session_id,
+            "workspace_path": self.workspace_path,
+            "repo_name": self.repo_name,
+            "org_name": self.org_name,
+            "created_at": self.created_at,
+            "panes": [
+                {
+                    "id": p.id,
+                    "pane_index": p.pane_index,
+                    "command": p.command,
+                    "is_main": p.is_main,
+                    "worktree_path": p.worktree_path,
+                    "tmux_pane_id": p.tmux_pane_id,
+                }
+                for p in self.panes
+            ],
+            "window_id": self.window_id,
+            "tmux_session_name": self.tmux_session_name,
+        }
+
     def save(self) -> None:
         """Persist session to disk."""
-        SESSIONS_DIR.mkdir(parents=True, exist_ok=True)
-        session_file = SESSIONS_DIR / f"{self.session_id}.json"
-        with open(session_file, "w") as f:
-            json.dump(asdict(self), f, indent=2)
+        payload = json.dumps(self.to_dict(), indent=2).encode()
+        with _sessions_lock():
+            session_file = SESSIONS_DIR / f"{self.session_id}.json"
+            # Write to a temp file and rename so readers never see a partial file
+            tmp_file = session_file.with_suffix(".json.tmp")
+            tmp_file.write_bytes(payload)
+            os.replace(tmp_file, session_file)
+            _update_index(self.session_id, _summary_entry(self))
 
     def delete(self) -> None:
         """Remove session file from disk."""
-        session_file = SESSIONS_DIR / f"{self.session_id}.json"
-        if session_file.exists():
-            session_file.unlink()
+        if not SESSIONS_DIR.exists():
+            return
+        with _sessions_lock():
+            (SESSIONS_DIR / f"{self.session_id}.json").unlink(missing_ok=True)
+            _update_index(self.session_id, None)
+
+
+def _read_session_data(session_id: str) -> dict[str, Any]:
+    """Read and parse a session file."""
+    return json.loads((SESSIONS_DIR / f"{session_id}.json").read_bytes())
+
+
+class SessionSummary(NamedTuple):
+    """One-line view of a session, as stored in the index sidecar."""
+
+    session_id: str
+    org_name: str
+    repo_name: str
+    created_at: str
+    pane_count: int
+    tmux_session_name: str | None
+
+
+# Keys of a well-formed index entry (the session id is the entry's key)
+_SUMMARY_KEYS = frozenset(SessionSummary._fields[1:])
+
+
+def _summary_entry(session: AgentSession) -> dict[str, Any]:
+    """Build the index entry for a session."""
+    return {
+        "org_name": session.org_name,
+        "repo_name": session.repo_name,
+        "created_at": session.created_at,
+        "pane_count": len(session.panes),
+        "tmux_session_name": session.tmux_session_name,
+    }
+
+
+def _summary_entry_from_data(data: dict[str, Any]) -> dict[str, Any]:
+    """Build the index entry from parsed session JSON, without hydrating panes."""
+    return {
+        "org_name": data["org_name"],
+        "repo_name": data["repo_name"],
+        "created_at": data["created_at"],
+        "pane_count": len(data.get("panes", [])),
+        "tmux_session_name": data.get("tmux_session_name"),
+    }
+
+
+@contextlib.contextmanager
+def _sessions_lock() -> Iterator[None]:
+    """
+    Hold an exclusive flock while writing session files and the index, so
+    concurrent processes can't interleave writes or lose index updates.
+    Raises RuntimeError if the lock isn't acquired within SESSIONS_LOCK_TIMEOUT.
+    """
+    lock_path = _ensure_sessions_dir() / SESSIONS_LOCK_FILE
+    try:
+        fd = os.open(lock_path, os.O_WRONLY | os.O_CREAT, 0o644)
+    except FileNotFoundError:
+        # Directory was removed after we created it; recreate and retry once
+        lock_path = _ensure_sessions_dir(force=True) / SESSIONS_LOCK_FILE
+        fd = os.open(lock_path, os.O_WRONLY | os.O_CREAT, 0o644)
+
+    try:
+        deadline = time.monotonic() + SESSIONS_LOCK_TIMEOUT
+        while True:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                break
+            except BlockingIOError:
+                if time.monotonic() >= deadline:
+                    raise RuntimeError(f"Timed out waiting for lock: {lock_path}") from None
+                time.sleep(0.05)
+        yield
+    finally:
+        os.close(fd)  # closing the descriptor releases the lock
+
+
+def _read_index() -> dict[str, dict[str, Any]] | None:
+    """Read the index sidecar; None if missing or unreadable."""
+    try:
+        index = json.loads((SESSIONS_DIR / INDEX_FILE).read_bytes())
+    except FileNotFoundError, json.JSONDecodeError:
+        return None
+    return index if isinstance(index, dict) else None  # pyright: ignore[reportUnknownVariableType]
+
+
+def _write_index(index: dict[str, dict[str, Any]]) -> None:
+    """Atomically replace the index sidecar. Caller holds the sessions lock.
+
+    The index is rewritten on every save and never edited by hand, so it is
+    stored compact rather than indented like the session files.
+    """
+    index_file = SESSIONS_DIR / INDEX_FILE
+    tmp_file = index_file.with_suffix(".json.tmp")
+    tmp_file.write_bytes(json.dumps(index, separators=(",", ":")).encode())
+    os.replace(tmp_file, index_file)
+
+
+def _update_index(session_id: str, entry: dict[str, Any] | None) -> None:
+    """
+    Add/replace (or, with entry=None, remove) one session in the index.
+    Caller holds the sessions lock.
+    """
+    index = _read_index()
+    if index is None:
+        # Missing index: the next listing rebuilds it from the session files
+        return
+    if entry is None:
+        index.pop(session_id, None)
+    else:
+        index[session_id] = entry
+    _write_index(index)
+
+
+def _valid_entry(entry: object) -> bool:
+    """Whether an index entry has exactly the fields SessionSummary expects."""
+    return isinstance(entry, dict) and entry.keys() == _SUMMARY_KEYS
+
+
+def _rebuild_index() -> tuple[list[str], dict[str, dict[str, Any]]]:
+    """
+    Rebuild the index from the session files on disk, returning the session
+    ids found and the new index. The files are listed and read under the
+    sessions lock, so a concurrent save can't slip in before the write.
+    """
+    index: dict[str, dict[str, Any]] = {}
+    with _sessions_lock():
+        session_ids = _session_ids()
+        for session_id in session_ids:
+            try:
+                data = _read_session_data(session_id)
+                index[session_id] = _summary_entry_from_data(data)
+            except FileNotFoundError, json.JSONDecodeError, KeyError, TypeError:
+                continue
+        _write_index(index)
+    return session_ids, index
+
+
+def list_session_summaries() -> list[SessionSummary]:
+    """
+    List saved sessions from the index sidecar, newest first.
+
+    Only the index is parsed. It is rebuilt from the session files if it is
+    missing, doesn't match the files on disk, or has entries written with
+    other fields (e.g. by an older or newer version).
+    """
+    session_ids = _session_ids()
+    if not session_ids:
+        return []
+
+    index = _read_index()
+    if (
+        index is None
+        or index.keys() != set(session_ids)
+        or not all(_valid_entry(entry) for entry in index.values())
+    ):
+        session_ids, index = _rebuild_index()
+
+    summaries: list[SessionSummary] = []
+    for session_id in session_ids:
+        entry = index.get(session_id)
+        if entry is not None:
+            summaries.append(SessionSummary(session_id=session_id, **entry))
+    return summaries
+
+
+def _session_ids() -> list[str]:
+    """Return saved session ids, newest first (ids embed a sortable timestamp)."""
+    try:
+        with os.scandir(SESSIONS_DIR) as entries:
+            ids = [
+                e.name[:-5]
+                for e in entries
+                if e.name.endswith(".json") and not e.name.startswith("_")
+            ]
+    except FileNotFoundError:
+        return []
+    ids.sort(reverse=True)
+    return ids
 
 
 def list_sessions() -> list[AgentSession]:
     """List all saved sessions."""
     sessions: list[AgentSession] = []
-    if not SESSIONS_DIR.exists():
-        return sessions
-
-    for session_file in sorted(SESSIONS_DIR.glob("*.json"), reverse=True):
+    for session_id in _session_ids():
         try:
-            session = AgentSession.load(session_file.stem)
+            session = AgentSession.load(session_id)
             sessions.append(session)
         except json.JSONDecodeError, KeyError:
             continue
@@ -80,8 +306,13 @@ def list_sessions() -> list[AgentSession]:
 
 def get_most_recent_session() -> AgentSession | None:
     """Get the most recently created session."""
-    sessions = list_sessions()
-    return sessions[0] if sessions else None
+    # Only load the newest file, falling back to older ones if it is unreadable
+    for session_id in _session_ids():
+        try:
+            return AgentSession.load(session_id)
+        except json.JSONDecodeError, KeyError:
+            continue
+    return None
 
 
 def find_pane_by_target(session: AgentSession, target: str) -> tuple[AgentPane, int] | None:
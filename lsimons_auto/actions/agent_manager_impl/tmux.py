@@ -5,21 +5,38 @@ Provides functions for creating and managing tmux sessions, windows, and panes.
 Replaces AppleScript/Ghostty for reliable operation in VMs.
 """
 
+import functools
 import os
+import shutil
 import subprocess
 from pathlib import Path
 
 
-def run_tmux(*args: str, check: bool = True) -> str:
-    """Execute tmux command and return output."""
+@functools.lru_cache(maxsize=1)
+def tmux_binary() -> str:
+    """Absolute path of tmux, resolved once so each call skips the PATH search.
+
+    Falls back to plain "tmux" when it isn't on PATH, so running it still
+    raises FileNotFoundError.
+    """
+    return shutil.which("tmux") or "tmux"
+
+
+def run_tmux(*args: str, check: bool = True, capture: bool = True) -> str:
+    """Execute tmux command and return output.
+
+    Pass capture=False for commands whose output is unused: stdout then goes
+    to /dev/null and "" is returned. stderr is always kept for error messages.
+    """
     try:
         result = subprocess.run(
-            ["tmux", *args],
+            [tmux_binary(), *args],
             check=check,
             text=True,
-            capture_output=True,
+            stdout=subprocess.PIPE if capture else subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
         )
-        return result.stdout.strip()
+        return result.stdout.strip() if capture else ""
     except subprocess.CalledProcessError as e:
         raise RuntimeError(f"tmux command failed: {e.stderr}") from e
     except FileNotFoundError:
@@ -29,15 +46,25 @@ def run_tmux(*args: str, check: bool = True) -> str:
 def session_exists(session_name: str) -> bool:
     """Check if a tmux session exists."""
     try:
-        run_tmux("has-session", "-t", session_name, check=True)
+        run_tmux("has-session", "-t", session_name, check=True, capture=False)
         return True
     except RuntimeError:
         return False
 
 
+def list_tmux_sessions() -> set[str]:
+    """Names of all running tmux sessions, from a single tmux call."""
+    try:
+        # Exits non-zero with "no server running" when there are no sessions
+        output = run_tmux("list-sessions", "-F", "#{session_name}", check=False)
+    except RuntimeError:
+        return set()
+    return set(output.splitlines())
+
+
 def create_session(session_name: str, working_dir: Path) -> str:
     """Create a new detached tmux session. Returns the pane ID of the first pane."""
-    run_tmux(
+    pane_id = run_tmux(
         "new-session",
         "-d",  # detached
         "-s",
@@ -48,15 +75,7 @@ def create_session(session_name: str, working_dir: Path) -> str:
         "-F",
         "#{pane_id}",  # print pane ID
     )
-    # Get the pane ID of the initial pane
-    pane_id = run_tmux(
-        "list-panes",
-        "-t",
-        session_name,
-        "-F",
-        "#{pane_id}",
-    )
-    return pane_id.split("\n")[0]
+    return pane_id.split("\n", 1)[0]
 
 
 def split_window_horizontal(session_name: str, working_dir: Path) -> str:
@@ -91,65 +110,86 @@ def split_window_vertical(session_name: str, working_dir: Path) -> str:
     return output
 
 
-def split_pane_horizontal(pane_id: str, working_dir: Path) -> str:
-    """Split a specific pane horizontally. Returns new pane ID."""
-    output = run_tmux(
-        "split-window",
-        "-h",
-        "-t",
-        pane_id,
-        "-c",
-        str(working_dir),
-        "-P",
-        "-F",
-        "#{pane_id}",
-    )
-    return output
+def split_pane_horizontal(pane_id: str, working_dir: Path, size: str | None = None) -> str:
+    """Split a specific pane horizontally. Returns new pane ID.
 
+    size is the new pane's size as tmux `-l` takes it (e.g. "50%").
+    """
+    args = ["split-window", "-h", "-t", pane_id, "-c", str(working_dir)]
+    if size:
+        args.extend(["-l", size])
+    return run_tmux(*args, "-P", "-F", "#{pane_id}")
 
-def split_pane_vertical(pane_id: str, working_dir: Path) -> str:
-    """Split a specific pane vertically. Returns new pane ID."""
-    output = run_tmux(
-        "split-window",
-        "-v",
-        "-t",
-        pane_id,
-        "-c",
-        str(working_dir),
-        "-P",
-        "-F",
-        "#{pane_id}",
-    )
-    return output
+
+def split_pane_vertical(pane_id: str, working_dir: Path, size: str | None = None) -> str:
+    """Split a specific pane vertically. Returns new pane ID.
+
+    size is the new pane's size as tmux `-l` takes it (e.g. "50%").
+    """
+    args = ["split-window", "-v", "-t", pane_id, "-c", str(working_dir)]
+    if size:
+        args.extend(["-l", size])
+    return run_tmux(*args, "-P", "-F", "#{pane_id}")
 
 
 def select_pane(pane_id: str) -> None:
     """Focus a specific pane."""
-    run_tmux("select-pane", "-t", pane_id)
+    run_tmux("select-pane", "-t", pane_id, capture=False)
+
+
+def _literal_arg(text: str) -> str:
+    """Escape a trailing ';', which tmux would otherwise take as a command separator."""
+    if text.endswith(";"):
+        return text[:-1] + "\\;"
+    return text
 
 
 def send_keys(pane_id: str, text: str, enter: bool = True) -> None:
     """Send text to a pane, optionally followed by Enter."""
-    args = ["send-keys", "-t", pane_id, text]
+    args = ["send-keys", "-t", pane_id, _literal_arg(text)]
     if enter:
         args.append("Enter")
-    run_tmux(*args)
+    run_tmux(*args, capture=False)
+
+
+def run_tmux_script(commands: list[list[str]], capture: bool = True) -> str:
+    """Run several tmux commands in one invocation, chained with ';'.
+
+    The commands run in order as one unit on the server. Returns their
+    combined output, e.g. one line per command that used -P.
+    """
+    args: list[str] = []
+    for command in commands:
+        if args:
+            args.append(";")
+        args.extend(_literal_arg(arg) for arg in command)
+    return run_tmux(*args, capture=capture) if args else ""
+
+
+def send_keys_multi(pane_ids: list[str], text: str, enter: bool = True) -> None:
+    """Send the same text to several panes with one tmux invocation.
+
+    The per-pane send-keys commands are chained with ';' so a broadcast costs
+    one process spawn instead of one per pane.
+    """
+    keys = [text, "Enter"] if enter else [text]
+    run_tmux_script([["send-keys", "-t", pane_id, *keys] for pane_id in pane_ids], capture=False)
 
 
 def kill_pane(pane_id: str) -> None:
     """Kill a specific pane."""
-    run_tmux("kill-pane", "-t", pane_id)
+    run_tmux("kill-pane", "-t", pane_id, capture=False)
 
 
 def kill_session(session_name: str) -> None:
     """Kill an entire tmux session."""
-    run_tmux("kill-session", "-t", session_name)
+    run_tmux("kill-session", "-t", session_name, capture=False)
 
 
 def attach_session(session_name: str) -> None:
     """Attach to a tmux session (replaces current process)."""
     # Use exec to replace current process
-    os.execvp("tmux", ["tmux", "attach-session", "-t", session_name])
+    os.execvp(tmux_binary(), ["tmux", "attach-session", "-t", session_name])
 
 
 def list_panes(session_name: str) -> list[str]:
@@ -168,7 +208,7 @@ def list_panes(session_name: str) -> list[str]:
 
 def resize_pane(pane_id: str, direction: str, amount: int) -> None:
     """Resize a pane in the given direction (L/R/U/D)."""
-    run_tmux("resize-pane", "-t", pane_id, f"-{direction}", str(amount))
+    run_tmux("resize-pane", "-t", pane_id, f"-{direction}", str(amount), capture=False)
 
 
 def select_layout(session_name: str, layout: str) -> None:
@@ -176,7 +216,7 @@ def select_layout(session_name: str, layout: str) -> None:
 
     Layouts: even-horizontal, even-vertical, main-horizontal, main-vertical, tiled
     """
-    run_tmux("select-layout", "-t", session_name, layout)
+    run_tmux("select-layout", "-t", session_name, layout, capture=False)
 
 
 def get_pane_info(session_name: str) -> list[dict[str, str]]:
@@ -206,11 +246,14 @@ def get_pane_info(session_name: str) -> list[dict[str, str]]:
     return panes
 
 
+# Direction name -> tmux select-pane flag letter
+PANE_DIRECTIONS = {"up": "U", "down": "D", "left": "L", "right": "R"}
+
+
 def focus_pane_direction(session_name: str, direction: str) -> None:
     """Focus pane in given direction (U/D/L/R)."""
-    direction_map = {"up": "U", "down": "D", "left": "L", "right": "R"}
-    tmux_dir = direction_map.get(direction.lower(), direction.upper())
-    run_tmux("select-pane", "-t", session_name, f"-{tmux_dir}")
+    tmux_dir = PANE_DIRECTIONS.get(direction.lower(), direction.upper())
+    run_tmux("select-pane", "-t", session_name, f"-{tmux_dir}", capture=False)
 
 
 def is_inside_tmux() -> bool:
@@ -4,6 +4,8 @@ workspace.py - Workspace discovery and fuzzy matching.
 Provides functions to scan for git repositories and match user queries.
 """
 
+import os
+from collections.abc import Iterable
 from pathlib import Path
 
 # Constants
@@ -22,26 +24,48 @@ def discover_workspaces(
 
     workspaces: dict[str, dict[str, Path]] = {}
 
-    if not git_root.exists():
+    try:
+        root_entries = os.scandir(git_root)
+    except FileNotFoundError, NotADirectoryError:
         return workspaces
 
-    for org_dir in git_root.iterdir():
-        if not org_dir.is_dir() or org_dir.name.startswith("."):
-            continue
+    with root_entries:
+        for org_entry in root_entries:
+            if org_entry.name.startswith(".") or not org_entry.is_dir():
+                continue
+
+            org_dir = git_root / org_entry.name
+            repos: dict[str, Path] = {}
+            with os.scandir(org_entry.path) as repo_entries:
+                for repo_entry in repo_entries:
+                    if (
+                        not repo_entry.name.startswith(".")
+                        and not repo_entry.name.endswith("-worktrees")
+                        and repo_entry.is_dir()
+                    ):
+                        repos[repo_entry.name] = org_dir / repo_entry.name
+
+            if repos:
+                workspaces[org_entry.name] = repos
 
-        repos: dict[str, Path] = {}
-        for repo_dir in org_dir.iterdir():
-            if (
-                repo_dir.is_dir()
-                and not repo_dir.name.startswith(".")
-                and not repo_dir.name.endswith("-worktrees")
-            ):
-                repos[repo_dir.name] = repo_dir
+    return workspaces
 
-        if repos:
-            workspaces[org_dir.name] = repos
 
-    return workspaces
+def _match_name(query: str, names: Iterable[str]) -> list[str]:
+    """Return names containing query, narrowed to an exact match if that is unique."""
+    query = query.lower()
+    matches: list[str] = []
+    exact: list[str] = []
+    # Single pass: exact matches are always substring matches too
+    for real in names:
+        lower = real.lower()
+        if query in lower:
+            matches.append(real)
+            if lower == query:
+                exact.append(real)
+    if len(matches) > 1 and len(exact) == 1:
+        return exact
+    return matches
 
 
 def fuzzy_match_workspace(
@@ -54,32 +78,22 @@ def fuzzy_match_workspace(
     Returns (org, repo, path).
     Raises ValueError if ambiguous or not found.
     """
-    matching_orgs = [o for o in workspaces if query_org.lower() in o.lower()]
+    matching_orgs = _match_name(query_org, workspaces)
 
     if len(matching_orgs) == 0:
         raise ValueError(f"No org found matching '{query_org}'")
     if len(matching_orgs) > 1:
-        # Prefer exact match if available
-        exact = [o for o in matching_orgs if o.lower() == query_org.lower()]
-        if len(exact) == 1:
-            matching_orgs = exact
-        else:
-            raise ValueError(f"Ambiguous org match for '{query_org}': {matching_orgs}")
+        raise ValueError(f"Ambiguous org match for '{query_org}': {matching_orgs}")
 
     org = matching_orgs[0]
     repos = workspaces[org]
 
-    matching_repos = [r for r in repos if query_repo.lower() in r.lower()]
+    matching_repos = _match_name(query_repo, repos)
 
     if len(matching_repos) == 0:
         raise ValueError(f"No repo found matching '{query_repo}' in org '{org}'")
     if len(matching_repos) > 1:
-        # Prefer exact match if available
-        exact = [r for r in matching_repos if r.lower() == query_repo.lower()]
-        if len(exact) == 1:
-            matching_repos = exact
-        else:
-            raise ValueError(f"Ambiguous repo match for '{query_repo}': {matching_repos}")
+        raise ValueError(f"Ambiguous repo match for '{query_repo}': {matching_repos}")
 
     repo = matching_repos[0]
     return (org, repo, repos[repo])
@@ -5,10 +5,16 @@ Provides functions to create and manage git worktrees for parallel Claude sessio
 """
 
 import contextlib
+import shutil
 import subprocess
-from datetime import UTC, datetime
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Concurrent `git worktree add` runs can briefly collide on git's *.lock files
+WORKTREE_LOCK_RETRIES = 5
+WORKTREE_LOCK_BACKOFF = 0.1  # seconds, doubled after each retry
+
 
 def ensure_worktrees_dir(workspace_path: Path) -> Path:
     """
@@ -29,6 +35,17 @@ def ensure_worktrees_dir(workspace_path: Path) -> Path:
     return worktrees_dir
 
 
+def _branch_exists(workspace_path: Path, branch_name: str) -> bool:
+    """Check whether a local branch exists in the repository."""
+    result = subprocess.run(
+        ["git", "rev-parse", "--verify", "--quiet", f"refs/heads/{branch_name}"],
+        cwd=workspace_path,
+        check=False,
+        capture_output=True,
+    )
+    return result.returncode == 0
+
+
 def ensure_worktree(
     workspace_path: Path,
     worktree_name: str,
@@ -54,30 +71,77 @@ def ensure_worktree(
         # Worktree already exists, verify it's valid
         if (worktree_path / ".git").exists():
             return worktree_path
-        # Directory exists but isn't a worktree - remove it
-        import shutil
-
+        # Directory exists but isn't a worktree - remove it, and drop git's
+        # record of it so the add below doesn't fail on a stale registration
         shutil.rmtree(worktree_path)
-
-    # Generate unique branch name with timestamp
-    timestamp = datetime.now(UTC).strftime("%Y%m%d-%H%M%S")
-    branch_name = f"{worktree_name}-{timestamp}"
-
-    # Create the worktree with a new branch
-    try:
         subprocess.run(
-            ["git", "worktree", "add", "-b", branch_name, str(worktree_path)],
+            ["git", "worktree", "prune"],
             cwd=workspace_path,
-            check=True,
+            check=False,
             capture_output=True,
-            text=True,
         )
-    except subprocess.CalledProcessError as e:
-        raise RuntimeError(f"Failed to create worktree '{worktree_name}': {e.stderr}") from e
+
+    # Generate unique branch name with timestamp
+    timestamp = time.strftime("%Y%m%d-%H%M%S", time.gmtime())
+    branch_name = f"{worktree_name}-{timestamp}"
+
+    # Create the worktree with a new branch, retrying if another git process
+    # holds one of the repository's lock files
+    add_args = ["-b", branch_name, str(worktree_path)]
+    for attempt in range(WORKTREE_LOCK_RETRIES + 1):
+        try:
+            subprocess.run(
+                ["git", "worktree", "add", *add_args],
+                cwd=workspace_path,
+                check=True,
+                capture_output=True,
+                text=True,
+            )
+            break
+        except subprocess.CalledProcessError as e:
+            if attempt < WORKTREE_LOCK_RETRIES and ".lock" in (e.stderr or ""):
+                time.sleep(WORKTREE_LOCK_BACKOFF * 2**attempt)
+                # The failed attempt may have created the branch before hitting
+                # the lock; check out the existing branch instead of recreating it
+                if _branch_exists(workspace_path, branch_name):
+                    add_args = [str(worktree_path), branch_name]
+                continue
+            raise RuntimeError(f"Failed to create worktree '{worktree_name}': {e.stderr}") from e
 
     return worktree_path
 
 
+def ensure_worktrees(
+    workspace_path: Path,
+    worktree_names: list[str],
+    worktrees_dir: Path,
+) -> dict[str, Path]:
+    """
+    Create several git worktrees concurrently.
+
+    Each `git worktree add` is independent, so they run in parallel threads
+    rather than one after another.
+
+    Args:
+        workspace_path: Path to the original git repository
+        worktree_names: Names for the worktree directories (e.g., ["M", "001"])
+        worktrees_dir: Directory to create worktrees in
+
+    Returns:
+        Mapping of worktree name to worktree directory
+    """
+    if not worktree_names:
+        return {}
+    with ThreadPoolExecutor(max_workers=len(worktree_names)) as executor:
+        paths = executor.map(
+            ensure_worktree,
+            [workspace_path] * len(worktree_names),
+            worktree_names,
+            [worktrees_dir] * len(worktree_names),
+        )
+        return dict(zip(worktree_names, paths, strict=True))
+
+
 def get_worktree_branch(worktree_path: Path) -> str:
     """
     Get the branch name for a worktree.
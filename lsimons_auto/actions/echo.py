@@ -6,18 +6,27 @@ This action echoes back the provided arguments, making it ideal for
 testing the command dispatcher without side effects.
 """
 
-import argparse
+import sys
 
 
 def main(args: list[str] | None = None) -> None:
     """Echo the provided message with optional formatting."""
+    argv = sys.argv[1:] if args is None else args
+
+    # Fast path: plain words (no options) need no argparse
+    if not any(arg.startswith("-") for arg in argv):
+        print(" ".join(argv) if argv else "Hello, World!")
+        return
+
+    import argparse
+
     parser = argparse.ArgumentParser(description="Echo a message")
 
     parser.add_argument("message", nargs="*", help="Message to echo")
     parser.add_argument("--upper", action="store_true", help="Convert to uppercase")
     parser.add_argument("--prefix", default="", help="Prefix to add")
 
-    parsed_args = parser.parse_args(args)
+    parsed_args = parser.parse_args(argv)
 
     message = " ".join(parsed_args.message) if parsed_args.message else "Hello, World!"
 
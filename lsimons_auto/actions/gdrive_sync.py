@@ -14,11 +14,27 @@ import socket
 import subprocess
 import sys
 
+# rclone defaults are 4 transfers and 8 checkers; Drive latency rewards more
+DEFAULT_TRANSFERS = 16
+DEFAULT_CHECKERS = 32
+
 
 def main(args: list[str] | None = None) -> None:
     """Main function that performs the action work."""
     parser = argparse.ArgumentParser(description="Sync Google Drive to local volume")
-    _ = parser.parse_args(args)
+    parser.add_argument(
+        "--transfers",
+        type=int,
+        default=DEFAULT_TRANSFERS,
+        help="Number of file transfers rclone runs in parallel",
+    )
+    parser.add_argument(
+        "--checkers",
+        type=int,
+        default=DEFAULT_CHECKERS,
+        help="Number of equality checkers rclone runs in parallel",
+    )
+    parsed_args = parser.parse_args(args)
 
     # 1. Check Hostname
     hostname = socket.gethostname()
@@ -56,7 +72,24 @@ def main(args: list[str] | None = None) -> None:
     try:
         # Using subprocess to call rclone
         # We allow stdout/stderr to flow to the console
-        subprocess.run([rclone_path, "sync", source, destination, "--verbose"], check=True)
+        # --fast-list trades memory for far fewer Drive listing requests
+        subprocess.run(
+            [
+                rclone_path,
+                "sync",
+                source,
+                destination,
+                "--fast-list",
+                "--transfers",
+                str(parsed_args.transfers),
+                "--checkers",
+                str(parsed_args.checkers),
+                "--drive-chunk-size",
+                "64M",
+                "--verbose",
+            ],
+            check=True,
+        )
         print("Sync completed successfully.")
     except subprocess.CalledProcessError as e:
         print(f"Error executing rclone: {e}")
@@ -9,12 +9,18 @@ Archived repos go to ~/git/<owner>/archive (if enabled).
 
 import argparse
 import fnmatch
+import functools
+import io
 import json
 import socket
 import subprocess
 import sys
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, NamedTuple
+from typing import Any, NamedTuple, TextIO, override
 
 
 class OwnerConfig(NamedTuple):
@@ -78,6 +84,71 @@ class BotRemoteContext(NamedTuple):
     bot_fork_map: dict[str, str]  # Maps "owner/repo" -> fork_url
 
 
+# Default number of repositories synced concurrently (--jobs)
+DEFAULT_JOBS = 8
+
+
+class _ThreadOutput(io.TextIOBase):
+    """sys.stdout stand-in that sends each worker thread's prints to its own buffer.
+
+    Threads without a buffer (the main thread) write straight through.
+    """
+
+    def __init__(self, target: TextIO) -> None:
+        super().__init__()
+        self.target = target
+        self.local = threading.local()
+
+    @override
+    def write(self, s: str) -> int:
+        buffer: io.StringIO | None = getattr(self.local, "buffer", None)
+        return (buffer or self.target).write(s)
+
+    @override
+    def flush(self) -> None:
+        self.target.flush()
+
+    @override
+    def close(self) -> None:
+        # The wrapped stream isn't ours to flush or close (IOBase.__del__ calls this)
+        pass
+
+
+def run_jobs(jobs: list[Callable[[], object]], max_workers: int) -> None:
+    """
+    Run independent jobs (typically one per repo) on a thread pool.
+
+    Each job's output is buffered and printed as one block when it finishes,
+    so lines from concurrent git commands don't interleave. With a single
+    worker the jobs simply run in order.
+    """
+    if max_workers <= 1 or len(jobs) <= 1:
+        for job in jobs:
+            job()
+        return
+
+    output = _ThreadOutput(sys.stdout)
+    print_lock = threading.Lock()
+
+    def run(job: Callable[[], object]) -> None:
+        output.local.buffer = io.StringIO()
+        try:
+            job()
+        finally:
+            with print_lock:
+                output.target.write(output.local.buffer.getvalue())
+                output.target.flush()
+            output.local.buffer = None
+
+    sys.stdout = output
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for future in [executor.submit(run, job) for job in jobs]:
+                future.result()
+    finally:
+        sys.stdout = output.target
+
+
 def get_command_output(cmd: list[str], cwd: Path | None = None) -> str | None:
     """Run a command and return its stdout, or None on failure."""
     try:
@@ -142,7 +213,8 @@ def run_command(cmd: list[str], cwd: Path | None = None) -> bool:
     """
     Run a shell command.
     Returns True if successful, False otherwise.
-    Output is suppressed unless the command fails.
+    Output is suppressed unless the command fails, and is kept as bytes
+    so it is only decoded when there is an error to report.
     """
     try:
         _ = subprocess.run(
@@ -151,7 +223,6 @@ def run_command(cmd: list[str], cwd: Path | None = None) -> bool:
             check=True,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
-            text=True,
         )
         return True
     except subprocess.CalledProcessError as e:
@@ -159,13 +230,23 @@ def run_command(cmd: list[str], cwd: Path | None = None) -> bool:
         if cwd:
             print(f"  Directory: {cwd}")
         print("  Output:")
-        print(e.stdout)
+        print(e.stdout.decode(errors="replace") if e.stdout else "")
         return False
 
 
-def get_repos(owner: str, archive: bool = False) -> list[str]:
-    """Fetch list of repositories using gh CLI."""
-    # gh repo list owner -L 200 --json name,isFork,isArchived
+class RepoLists(NamedTuple):
+    """An owner's non-fork repository names, split by archived state."""
+
+    active: list[str]
+    archived: list[str]
+
+
+# gh filters out forks itself and prints one "<name>\t<isArchived>" line per repo
+_REPO_LIST_JQ = '.[] | select(.isFork | not) | "\\(.name)\\t\\(.isArchived)"'
+
+
+def get_repo_lists(owner: str) -> RepoLists:
+    """Fetch active and archived repositories with a single gh CLI call."""
     cmd = [
         "gh",
         "repo",
@@ -175,33 +256,34 @@ def get_repos(owner: str, archive: bool = False) -> list[str]:
         "200",
         "--json",
         "name,isFork,isArchived",
+        "--jq",
+        _REPO_LIST_JQ,
     ]
     try:
         result = subprocess.run(cmd, check=True, capture_output=True, text=True)
-        repos_data = json.loads(result.stdout)
     except subprocess.CalledProcessError as e:
         print(f"Error fetching repo list: {e.stderr}")
         sys.exit(1)
-    except json.JSONDecodeError as e:
-        print(f"Error parsing gh output: {e}")
-        sys.exit(1)
     except FileNotFoundError:
         print("Error: 'gh' command not found. Please install GitHub CLI.")
         sys.exit(1)
 
-    # Filter repos
-    # .[] | select(.isFork == false && .isArchived == false) | .name
-    filtered_repos: list[str] = []
-    repos_list: list[dict[str, Any]] = repos_data  # pyright: ignore[reportAny]
-    for repo in repos_list:
-        if repo.get("isFork") is True:
-            continue
+    # Partition by archived state in one pass
+    repo_lists = RepoLists(active=[], archived=[])
+    for line in result.stdout.splitlines():
+        name, sep, archived = line.partition("\t")
+        if not sep or archived not in ("true", "false"):
+            print(f"Error parsing gh output: {line!r}")
+            sys.exit(1)
+        (repo_lists.archived if archived == "true" else repo_lists.active).append(name)
+
+    return repo_lists
 
-        is_repo_archived = repo.get("isArchived", False)
-        if archive and is_repo_archived or not archive and not is_repo_archived:
-            filtered_repos.append(str(repo["name"]))
 
-    return filtered_repos
+def get_repos(owner: str, archive: bool = False) -> list[str]:
+    """Fetch list of active (or, with archive=True, archived) repositories using gh CLI."""
+    repo_lists = get_repo_lists(owner)
+    return repo_lists.archived if archive else repo_lists.active
 
 
 def filter_repos_by_allowlist(repos: list[str], allowlist: tuple[str, ...] | None) -> list[str]:
@@ -510,6 +592,17 @@ def configure_fork_remotes(
         return False
 
 
+def fetched_within(repo_path: Path, seconds: float) -> bool:
+    """Return True if the repo's last fetch (FETCH_HEAD mtime) is under seconds old."""
+    if seconds <= 0:
+        return False
+    try:
+        fetched_at = (repo_path / ".git" / "FETCH_HEAD").stat().st_mtime
+    except OSError:
+        return False
+    return time.time() - fetched_at < seconds
+
+
 def sync_repo(
     owner: str,
     repo_name: str,
@@ -517,14 +610,20 @@ def sync_repo(
     fork_context: ForkContext | None = None,
     bot_context: BotRemoteContext | None = None,
     dry_run: bool = False,
+    min_interval: float = 0,
 ) -> bool:
     """
     Sync a single repository.
+    Repos fetched less than min_interval seconds ago are skipped.
     Returns True if successful, False otherwise.
     """
     repo_path = target_dir / repo_name
     success = False
 
+    if fetched_within(repo_path, min_interval):
+        print(f"Skipping {owner}/{repo_name} (fetched recently)")
+        return True
+
     if repo_path.exists():
         # git fetch --all
         print(f"Updating {owner}/{repo_name}...")
@@ -566,12 +665,46 @@ def sync_repo(
     return success
 
 
+def preview_remote_config(
+    owner: str,
+    repo_name: str,
+    target_dir: Path,
+    fork_context: ForkContext | None,
+    bot_context: BotRemoteContext | None,
+) -> None:
+    """Print the fork/bot remote changes sync_repo would make to an existing repo."""
+    repo_path = target_dir / repo_name
+    if not repo_path.exists():
+        return
+    repo_full_name = f"{owner}/{repo_name}"
+    if fork_context and repo_full_name in fork_context.fork_map:
+        fork_url = fork_context.fork_map[repo_full_name]
+        upstream_url = f"https://github.com/{owner}/{repo_name}.git"
+        configure_fork_remotes(repo_path, fork_url, upstream_url, True)
+    if bot_context and repo_full_name in bot_context.bot_fork_map:
+        bot_fork_url = bot_context.bot_fork_map[repo_full_name]
+        configure_bot_remote(repo_path, bot_fork_url, True)
+        sync_bot_fork(repo_path, owner, repo_name, bot_fork_url, True)
+
+
+def fetch_existing_repo(repo_path: Path, min_interval: float = 0) -> None:
+    """Fetch an existing repository and fast-forward its main branch if possible."""
+    if fetched_within(repo_path, min_interval):
+        print(f"Skipping existing repo: {repo_path.name} (fetched recently)")
+        return
+    print(f"Fetching existing repo: {repo_path.name}...")
+    if run_command(["git", "fetch", "--all"], cwd=repo_path):
+        try_fast_forward(repo_path)
+
+
 def fetch_directory_repos(
     directory: Path,
     visited_repos: set[Path],
     dry_run: bool = False,
     owner: str | None = None,
     hostname: str = "",
+    jobs: int = 1,
+    min_interval: float = 0,
 ) -> None:
     """Run git fetch on all git repositories in a directory that haven't been visited."""
     if not directory.exists():
@@ -579,6 +712,7 @@ def fetch_directory_repos(
 
     print(f"Scanning {directory} for additional repositories...")
 
+    fetches: list[Callable[[], object]] = []
     # Iterate over subdirectories
     for item in directory.iterdir():
         if not item.is_dir():
@@ -596,9 +730,9 @@ def fetch_directory_repos(
                 print(f"Would fetch existing repo: {item}")
                 try_fast_forward(item, dry_run)
             else:
-                print(f"Fetching existing repo: {item.name}...")
-                if run_command(["git", "fetch", "--all"], cwd=item):
-                    try_fast_forward(item, dry_run)
+                fetches.append(functools.partial(fetch_existing_repo, item, min_interval))
+
+    run_jobs(fetches, jobs)
 
 
 def main(args: list[str] | None = None) -> None:
@@ -624,6 +758,20 @@ def main(args: list[str] | None = None) -> None:
         help="Specific owner to sync (default: all)",
         choices=[cfg.name for cfg in OWNER_CONFIGS],
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=DEFAULT_JOBS,
+        help="Number of repositories to sync concurrently",
+    )
+    parser.add_argument(
+        "--min-interval",
+        type=float,
+        default=0,
+        metavar="SECONDS",
+        help="Skip existing repos fetched less than this many seconds ago",
+    )
     parsed_args = parser.parse_args(args)
 
     base_dir = Path.home() / "git"
@@ -672,83 +820,95 @@ def main(args: list[str] | None = None) -> None:
                 dirs_to_create.append(str(archive_dir))
             print(f"Would create directories: {', '.join(dirs_to_create)}")
 
+        # One gh call lists both the active and the archived repos
+        print(f"Fetching repository list for {owner}...")
+        repo_lists = get_repo_lists(owner)
+
         # Sync active repos
-        print(f"Fetching active repository list for {owner}...")
-        active_repos = filter_repos_by_allowlist(
-            get_repos(owner=owner, archive=False), config.repo_allowlist
-        )
+        active_repos = filter_repos_by_allowlist(repo_lists.active, config.repo_allowlist)
         active_repos = [
             r for r in active_repos if repo_hostname_allowed(owner, r, current_hostname)
         ]
         print(f"Found {len(active_repos)} active repositories for {owner}.")
 
+        syncs: list[Callable[[], object]] = []
         for repo in active_repos:
             repo_path = (owner_dir / repo).resolve()
             visited_repos.add(repo_path)
 
             if parsed_args.dry_run:
                 print(f"Would sync active repo: {owner}/{repo} to {owner_dir}")
-                # Still need to call sync_repo to handle fork/bot configuration in dry-run
-                repo_path = owner_dir / repo
-                if repo_path.exists():
-                    repo_full_name = f"{owner}/{repo}"
-                    if fork_context and repo_full_name in fork_context.fork_map:
-                        fork_url = fork_context.fork_map[repo_full_name]
-                        upstream_url = f"https://github.com/{owner}/{repo}.git"
-                        configure_fork_remotes(repo_path, fork_url, upstream_url, True)
-                    if bot_context and repo_full_name in bot_context.bot_fork_map:
-                        bot_fork_url = bot_context.bot_fork_map[repo_full_name]
-                        configure_bot_remote(repo_path, bot_fork_url, True)
-                        sync_bot_fork(repo_path, owner, repo, bot_fork_url, True)
+                preview_remote_config(owner, repo, owner_dir, fork_context, bot_context)
             else:
-                sync_repo(owner, repo, owner_dir, fork_context, bot_context, parsed_args.dry_run)
+                syncs.append(
+                    functools.partial(
+                        sync_repo,
+                        owner,
+                        repo,
+                        owner_dir,
+                        fork_context,
+                        bot_context,
+                        min_interval=parsed_args.min_interval,
+                    )
+                )
+        run_jobs(syncs, parsed_args.jobs)
 
         # Sync archived repos
         if parsed_args.include_archive:
             if config.allow_archived:
-                print(f"Fetching archived repository list for {owner}...")
                 archived_repos = filter_repos_by_allowlist(
-                    get_repos(owner=owner, archive=True), config.repo_allowlist
+                    repo_lists.archived, config.repo_allowlist
                 )
                 archived_repos = [
                     r for r in archived_repos if repo_hostname_allowed(owner, r, current_hostname)
                 ]
                 print(f"Found {len(archived_repos)} archived repositories for {owner}.")
 
+                syncs = []
                 for repo in archived_repos:
                     repo_path = (archive_dir / repo).resolve()
                     visited_repos.add(repo_path)
 
                     if parsed_args.dry_run:
                         print(f"Would sync archived repo: {owner}/{repo} to {archive_dir}")
-                        # Still need to check fork/bot configuration in dry-run
-                        repo_path = archive_dir / repo
-                        if repo_path.exists():
-                            repo_full_name = f"{owner}/{repo}"
-                            if fork_context and repo_full_name in fork_context.fork_map:
-                                fork_url = fork_context.fork_map[repo_full_name]
-                                upstream_url = f"https://github.com/{owner}/{repo}.git"
-                                configure_fork_remotes(repo_path, fork_url, upstream_url, True)
-                            if bot_context and repo_full_name in bot_context.bot_fork_map:
-                                bot_fork_url = bot_context.bot_fork_map[repo_full_name]
-                                configure_bot_remote(repo_path, bot_fork_url, True)
-                                sync_bot_fork(repo_path, owner, repo, bot_fork_url, True)
+                        preview_remote_config(owner, repo, archive_dir, fork_context, bot_context)
                     else:
-                        sync_repo(
-                            owner, repo, archive_dir, fork_context, bot_context, parsed_args.dry_run
+                        syncs.append(
+                            functools.partial(
+                                sync_repo,
+                                owner,
+                                repo,
+                                archive_dir,
+                                fork_context,
+                                bot_context,
+                                min_interval=parsed_args.min_interval,
+                            )
                         )
+                run_jobs(syncs, parsed_args.jobs)
             else:
                 print(f"Skipping archived repositories for {owner} (configured to ignore)")
 
         # Sync any other existing repos in the directories
         fetch_directory_repos(
-            owner_dir, visited_repos, parsed_args.dry_run, owner, current_hostname
+            owner_dir,
+            visited_repos,
+            parsed_args.dry_run,
+            owner,
+            current_hostname,
+            parsed_args.jobs,
+            parsed_args.min_interval,
         )
 
         # Only scan archive directory if archives are included
         if parsed_args.include_archive and archive_dir.exists():
             fetch_directory_repos(
-                archive_dir, visited_repos, parsed_args.dry_run, owner, current_hostname
+                archive_dir,
+                visited_repos,
+                parsed_args.dry_run,
+                owner,
+                current_hostname,
+                parsed_args.jobs,
+                parsed_args.min_interval,
             )
 
 
@@ -11,7 +11,7 @@ import sys
 import tempfile
 import unittest
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 from lsimons_auto.actions.agent_manager_impl import cli, session
 
@@ -108,6 +108,69 @@ class TestArgparseSubcommands(unittest.TestCase):
         with self.assertRaises(SystemExit):
             parser.parse_args([])
 
+    def test_parser_is_reused(self) -> None:
+        """Test the parser is built once and parses each call independently."""
+        parser = cli.create_parser()
+        self.assertIs(cli.create_parser(), parser)
+
+        first = parser.parse_args(["kill", "-f"])
+        second = parser.parse_args(["kill"])
+        self.assertIsNot(first, second)
+        self.assertTrue(first.force)
+        self.assertFalse(second.force)
+
+    def test_parser_for_one_subcommand(self) -> None:
+        """Test a parser built for one subcommand parses it like the full parser."""
+        argv = ["send", "001", "hello", "world", "-s", "test-session"]
+        parser = cli.create_parser("send")
+        self.assertEqual(parser.parse_args(argv), cli.create_parser().parse_args(argv))
+
+        # Other subcommands are still listed in usage and help
+        help_text = parser.format_help()
+        for name in cli.SUBCOMMANDS:
+            self.assertIn(name, help_text)
+
+    def test_fast_parse_matches_argparse(self) -> None:
+        """Test the hand-parsed fast path agrees with argparse or defers to it."""
+        parser = cli.create_parser()
+        fast_cases = [
+            ["send", "main", "hello", "world"],
+            ["send", "001", "hi", "-s", "auto-agent-1"],
+            ["broadcast", "run", "tests"],
+            ["broadcast", "go", "--session", "auto-agent-1"],
+            ["focus", "left"],
+            ["focus", "002", "-s", "auto-agent-1"],
+            ["list"],
+        ]
+        for argv in fast_cases:
+            with self.subTest(argv=argv):
+                self.assertEqual(cli._fast_parse(argv), parser.parse_args(argv))  # pyright: ignore[reportPrivateUsage]
+
+        slow_cases = [
+            [],
+            ["send", "main"],
+            ["send", "main", "-x"],
+            ["send", "--help"],
+            ["broadcast", "hi", "--exclude-main"],
+            ["focus", "left", "-s", "-v"],
+            ["list", "-v"],
+            ["kill", "-f"],
+            ["spawn", "org", "repo"],
+        ]
+        for argv in slow_cases:
+            with self.subTest(argv=argv):
+                self.assertIsNone(cli._fast_parse(argv))  # pyright: ignore[reportPrivateUsage]
+
+    def test_main_dispatches_to_handler(self) -> None:
+        """Test main() calls the handler registered for the subcommand."""
+        handler = Mock()
+        entry = cli.SUBCOMMANDS["list"]._replace(handler=handler)
+        with patch.dict(cli.SUBCOMMANDS, {"list": entry}):
+            cli.main(["list", "-v"])
+
+        handler.assert_called_once()
+        self.assertTrue(handler.call_args[0][0].verbose)
+
 
 class TestCLIHelp(unittest.TestCase):
     """Test CLI help output."""
@@ -198,6 +261,134 @@ class TestCmdList(unittest.TestCase):
                 # Should not raise
                 cli.cmd_list(args)
 
+    def test_cmd_list_summary_uses_index(self) -> None:
+        """Test non-verbose list prints one line per session from the index."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            sessions_dir = Path(tmpdir) / "sessions"
+            with (
+                patch.object(session, "SESSIONS_DIR", sessions_dir),
+                patch.object(cli, "list_tmux_sessions", return_value={"auto-agent-1"}),
+                patch("builtins.print") as mock_print,
+            ):
+                session.AgentSession(
+                    session_id="auto-agent-1",
+                    workspace_path="/test/path",
+                    repo_name="test-repo",
+                    org_name="test-org",
+                    created_at="2026-01-21T00:00:00Z",
+                    panes=[session.AgentPane("M-test-repo", 0, "claude", True)],
+                    tmux_session_name="auto-agent-1",
+                ).save()
+
+                args = cli.create_parser().parse_args(["list"])
+                cli.cmd_list(args)
+
+                mock_print.assert_called_once_with("auto-agent-1: test-org/test-repo (1 panes)")
+
+    def test_cmd_list_verbose_prints_once(self) -> None:
+        """Test verbose list output is written with a single print."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            sessions_dir = Path(tmpdir) / "sessions"
+            with (
+                patch.object(session, "SESSIONS_DIR", sessions_dir),
+                patch.object(cli, "list_tmux_sessions", return_value=set()),
+                patch("builtins.print") as mock_print,
+            ):
+                for session_id in ("auto-agent-1", "auto-agent-2"):
+                    session.AgentSession(
+                        session_id=session_id,
+                        workspace_path="/test/path",
+                        repo_name="test-repo",
+                        org_name="test-org",
+                        created_at="2026-01-21T00:00:00Z",
+                        panes=[session.AgentPane("M-test-repo", 0, "claude", True, None, "%0")],
+                        tmux_session_name=session_id,
+                    ).save()
+
+                cli.cmd_list(cli.create_parser().parse_args(["list", "-v"]))
+
+                mock_print.assert_called_once()
+                output = mock_print.call_args[0][0]
+                self.assertIn("\nSession: auto-agent-2 (tmux session gone)\n", output)
+                self.assertTrue(output.endswith("    - M-test-repo: claude (main) [%0]"))
+
+
+class TestCmdKill(unittest.TestCase):
+    """Test kill command confirmation."""
+
+    def _save_session(self) -> session.AgentSession:
+        agent_session = session.AgentSession(
+            "auto-agent-1", "/p", "repo", "org", "2026-01-21", tmux_session_name="auto-agent-1"
+        )
+        agent_session.save()
+        return agent_session
+
+    def test_kill_refuses_without_tty(self) -> None:
+        """Test kill without --force exits instead of prompting when stdin isn't a TTY."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            sessions_dir = Path(tmpdir) / "sessions"
+            with (
+                patch.object(session, "SESSIONS_DIR", sessions_dir),
+                patch.object(cli.sys, "stdin") as mock_stdin,
+                patch.object(cli, "kill_session") as mock_kill,
+                patch("builtins.print"),
+            ):
+                mock_stdin.isatty.return_value = False
+                self._save_session()
+
+                with self.assertRaises(SystemExit) as cm:
+                    cli.cmd_kill(cli.create_parser().parse_args(["kill"]))
+
+                self.assertEqual(cm.exception.code, 1)
+                mock_stdin.readline.assert_not_called()
+                mock_kill.assert_not_called()
+                self.assertTrue((sessions_dir / "auto-agent-1.json").exists())
+
+    def test_kill_prompts_on_tty(self) -> None:
+        """Test kill without --force asks for confirmation on a TTY."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            sessions_dir = Path(tmpdir) / "sessions"
+            with (
+                patch.object(session, "SESSIONS_DIR", sessions_dir),
+                patch.object(cli.sys, "stdin") as mock_stdin,
+                patch.object(cli, "session_exists", return_value=True),
+                patch.object(cli, "kill_session") as mock_kill,
+                patch("builtins.print"),
+            ):
+                mock_stdin.isatty.return_value = True
+                mock_stdin.readline.return_value = "y\n"
+                self._save_session()
+
+                cli.cmd_kill(cli.create_parser().parse_args(["kill"]))
+
+                mock_kill.assert_called_once_with("auto-agent-1")
+                self.assertFalse((sessions_dir / "auto-agent-1.json").exists())
+
+
+class TestLazyImports(unittest.TestCase):
+    """Test the package re-exports don't import every submodule up front."""
+
+    def test_submodule_import_stays_light(self) -> None:
+        """Test importing one submodule doesn't pull in cli/layout/worktree."""
+        code = (
+            "import sys\n"
+            "import lsimons_auto.actions.agent_manager_impl.session\n"
+            "from lsimons_auto.actions import agent_manager\n"
+            "pkg = 'lsimons_auto.actions.agent_manager_impl.'\n"
+            "print(sorted(m for m in ('cli', 'layout', 'worktree') if pkg + m in sys.modules))\n"
+            "agent_manager.AgentPane\n"
+            "from lsimons_auto.actions.agent_manager_impl import main\n"
+            "print(pkg + 'cli' in sys.modules)\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            cwd=Path(__file__).parent.parent.parent,
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.split("\n")[:2], ["[]", "True"])
+
 
 if __name__ == "__main__":
     unittest.main()
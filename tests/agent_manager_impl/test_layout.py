@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Tests for tmux layout creation and agent startup.
+
+Tests the layout.py module functionality. tmux calls are mocked.
+"""
+
+import unittest
+from pathlib import Path
+from unittest.mock import Mock, call, patch
+
+from lsimons_auto.actions.agent_manager_impl import layout
+from lsimons_auto.actions.agent_manager_impl.session import AgentPane
+
+
+class TestStartAgents(unittest.TestCase):
+    """Test starting agent commands in panes."""
+
+    @patch.object(layout, "send_keys_multi")
+    def test_start_agents_batches_same_command(self, mock_send: Mock) -> None:
+        """Test panes sharing a command are started with one tmux call."""
+        panes = [
+            AgentPane("M-repo", 0, "claude", True, tmux_pane_id="%0"),
+            AgentPane("001-repo", 1, "claude", False, tmux_pane_id="%1"),
+            AgentPane("002-repo", 2, "pi", False, tmux_pane_id="%2"),
+            AgentPane("003-repo", 3, "claude", False),
+        ]
+
+        layout.start_agents_in_panes(panes)
+
+        self.assertEqual(
+            mock_send.call_args_list,
+            [
+                call(["%0", "%1"], "claude", enter=True),
+                call(["%2"], "pi", enter=True),
+            ],
+        )
+
+
+class TestCreateLayout(unittest.TestCase):
+    """Test layout creation from the recipe table."""
+
+    def _create(self, num_subagents: int) -> tuple[list[AgentPane], Mock]:
+        def fake_worktrees(_ws: Path, names: list[str], worktrees_dir: Path) -> dict[str, Path]:
+            return {name: worktrees_dir / name for name in names}
+
+        with (
+            patch.object(layout, "ensure_worktrees_dir", return_value=Path("/repo-worktrees")),
+            patch.object(layout, "ensure_worktrees", side_effect=fake_worktrees),
+            patch.object(layout, "run_tmux_script") as mock_script,
+        ):
+            mock_script.return_value = "\n".join(f"%{i}" for i in range(num_subagents + 1))
+            panes = layout.create_layout(num_subagents, Path("/repo"), "claude", "repo", "s")
+        return panes, mock_script
+
+    def test_every_recipe_creates_one_pane_per_agent(self) -> None:
+        """Test each layout has main + N panes with distinct tmux pane ids."""
+        for num_subagents in range(5):
+            panes, mock_script = self._create(num_subagents)
+            mock_script.assert_called_once()
+            self.assertEqual(
+                [p.id for p in panes],
+                ["M-repo", "001-repo", "002-repo", "003-repo", "004-repo"][: num_subagents + 1],
+            )
+            self.assertEqual([p.pane_index for p in panes], list(range(num_subagents + 1)))
+            self.assertEqual(len({p.tmux_pane_id for p in panes}), num_subagents + 1)
+
+    def test_four_subagents_in_thirds(self) -> None:
+        """Test the 4-subagent layout splits into three columns without stray panes."""
+        panes, mock_script = self._create(4)
+
+        wt = "/repo-worktrees"
+        commands = mock_script.call_args[0][0]
+        self.assertEqual(
+            [c[:6] for c in commands[1:5]],
+            [
+                ["split-window", "-h", "-t", "s", "-c", f"{wt}/001"],
+                ["split-window", "-h", "-t", "s", "-c", f"{wt}/003"],
+                ["split-window", "-v", "-t", "s:.{last}", "-c", f"{wt}/002"],
+                ["split-window", "-v", "-t", "s:.{last}", "-c", f"{wt}/004"],
+            ],
+        )
+        self.assertEqual(commands[-1], ["select-pane", "-t", "s:.{top-left}"])
+        # Pane ids come back in split order: M, 001, 003, 002, 004
+        self.assertEqual([p.tmux_pane_id for p in panes], ["%0", "%1", "%3", "%2", "%4"])
+        self.assertEqual(panes[3].worktree_path, f"{wt}/003")
+
+    def test_unreachable_target_rejected(self) -> None:
+        """Test a recipe splitting a pane that can't be targeted by position fails."""
+        recipe = (
+            layout.LayoutStep("001", "h", "M"),
+            layout.LayoutStep("002", "v", "001"),
+            layout.LayoutStep("003", "v", "M"),
+        )
+        worktrees = {name: Path(name) for name in ("M", "001", "002", "003")}
+        with self.assertRaises(ValueError):
+            layout.layout_script(recipe, "s", worktrees)
+
+    @patch.object(layout, "run_tmux_script", return_value="%0")
+    @patch.object(layout, "ensure_worktrees")
+    @patch.object(layout, "ensure_worktrees_dir")
+    def test_unexpected_output(self, _dir: Mock, _worktrees: Mock, _script: Mock) -> None:
+        """Test a pane id count mismatch is reported rather than mis-assigned."""
+        with self.assertRaises(RuntimeError):
+            layout.create_layout(1, Path("/repo"), "claude", "repo", "s")
+
+
+if __name__ == "__main__":
+    unittest.main()
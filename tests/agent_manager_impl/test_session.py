@@ -6,7 +6,10 @@ Tests the session.py module functionality including AgentPane, AgentSession,
 session persistence, and pane finding.
 """
 
+import dataclasses
+import fcntl
 import json
+import shutil
 import tempfile
 import unittest
 from pathlib import Path
@@ -47,6 +50,103 @@ class TestSessionManagement(unittest.TestCase):
                 self.assertEqual(len(loaded.panes), 1)
                 self.assertEqual(loaded.panes[0].id, "M-test")
 
+    def test_session_to_dict_matches_asdict(self) -> None:
+        """Test the hand-built payload covers every dataclass field."""
+        test_session = session.AgentSession(
+            session_id="test-session",
+            workspace_path="/test/path",
+            repo_name="test-repo",
+            org_name="test-org",
+            created_at="2026-01-21T00:00:00Z",
+            panes=[
+                session.AgentPane(
+                    id="001-test",
+                    pane_index=1,
+                    command="claude",
+                    is_main=False,
+                    worktree_path="/wt",
+                    tmux_pane_id="%1",
+                )
+            ],
+            tmux_session_name="test-tmux",
+        )
+
+        self.assertEqual(test_session.to_dict(), dataclasses.asdict(test_session))
+
+    def test_session_save_rewrites_removed_file(self) -> None:
+        """Test saving again recreates a session file removed behind our back."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            sessions_dir = Path(tmpdir) / "sessions"
+            with patch.object(session, "SESSIONS_DIR", sessions_dir):
+                test_session = session.AgentSession(
+                    session_id="test-session",
+                    workspace_path="/test/path",
+                    repo_name="test-repo",
+                    org_name="test-org",
+                    created_at="2026-01-21T00:00:00Z",
+                )
+                test_session.save()
+                session_file = sessions_dir / "test-session.json"
+                session_file.unlink()
+
+                test_session.save()
+                self.assertTrue(session_file.exists())
+                self.assertEqual(
+                    [s.session_id for s in session.list_session_summaries()], ["test-session"]
+                )
+                self.assertEqual(list(sessions_dir.glob("*.tmp")), [])
+
+    def test_session_load_returns_independent_sessions(self) -> None:
+        """Test repeated loads don't share pane lists."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            sessions_dir = Path(tmpdir) / "sessions"
+            with patch.object(session, "SESSIONS_DIR", sessions_dir):
+                original = session.AgentSession("cached", "/p", "repo", "org", "2026-01-21")
+                original.panes.append(session.AgentPane("M-repo", 0, "claude", True))
+                original.save()
+
+                first = session.AgentSession.load("cached")
+                first.panes.append(session.AgentPane("001-repo", 1, "claude", False))
+                second = session.AgentSession.load("cached")
+                self.assertEqual(len(second.panes), 1)
+
+                first.save()
+                self.assertEqual(len(session.AgentSession.load("cached").panes), 2)
+
+    def test_session_save_recreates_removed_dir(self) -> None:
+        """Test saving still works if the sessions dir is removed mid-process."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            sessions_dir = Path(tmpdir) / "sessions"
+            with patch.object(session, "SESSIONS_DIR", sessions_dir):
+                first = session.AgentSession("first", "/p", "repo", "org", "2026-01-21")
+                first.save()
+                shutil.rmtree(sessions_dir)
+
+                second = session.AgentSession("second", "/p", "repo", "org", "2026-01-21")
+                second.save()
+                self.assertTrue((sessions_dir / "second.json").exists())
+
+    def test_session_save_waits_for_lock(self) -> None:
+        """Test save refuses to write while another process holds the lock."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            sessions_dir = Path(tmpdir) / "sessions"
+            sessions_dir.mkdir()
+            with (
+                patch.object(session, "SESSIONS_DIR", sessions_dir),
+                patch.object(session, "SESSIONS_LOCK_TIMEOUT", 0.1),
+                open(sessions_dir / session.SESSIONS_LOCK_FILE, "a") as holder,
+            ):
+                fcntl.flock(holder, fcntl.LOCK_EX)
+                test_session = session.AgentSession("locked", "/p", "repo", "org", "2026-01-21")
+
+                with self.assertRaises(RuntimeError):
+                    test_session.save()
+                self.assertFalse((sessions_dir / "locked.json").exists())
+
+                fcntl.flock(holder, fcntl.LOCK_UN)
+                test_session.save()
+                self.assertTrue((sessions_dir / "locked.json").exists())
+
     def test_session_delete(self) -> None:
         """Test session deletion."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -136,6 +236,29 @@ class TestListSessions(unittest.TestCase):
             with patch.object(session, "SESSIONS_DIR", sessions_dir):
                 recent = session.get_most_recent_session()
                 self.assertIsNotNone(recent)
+                assert recent is not None
+                self.assertEqual(recent.session_id, "test-session-2")
+
+    def test_get_most_recent_session_skips_corrupt(self) -> None:
+        """Test an unreadable newest session falls back to the next one."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            sessions_dir = Path(tmpdir) / "sessions"
+            sessions_dir.mkdir(parents=True)
+            session_data: dict[str, object] = {
+                "session_id": "test-session-1",
+                "workspace_path": "/test/path",
+                "repo_name": "test-repo",
+                "org_name": "test-org",
+                "created_at": "2026-01-21T01:00:00Z",
+                "panes": [],
+            }
+            (sessions_dir / "test-session-1.json").write_text(json.dumps(session_data))
+            (sessions_dir / "test-session-2.json").write_text("{not json")
+
+            with patch.object(session, "SESSIONS_DIR", sessions_dir):
+                recent = session.get_most_recent_session()
+                assert recent is not None
+                self.assertEqual(recent.session_id, "test-session-1")
 
     def test_get_most_recent_session_none(self) -> None:
         """Test getting most recent session when none exist."""
@@ -146,6 +269,153 @@ class TestListSessions(unittest.TestCase):
                 self.assertIsNone(recent)
 
 
+class TestSessionIndex(unittest.TestCase):
+    """Test the session index sidecar."""
+
+    def _make_session(self, session_id: str, panes: int = 1) -> session.AgentSession:
+        return session.AgentSession(
+            session_id=session_id,
+            workspace_path="/test/path",
+            repo_name="test-repo",
+            org_name="test-org",
+            created_at="2026-01-21T00:00:00Z",
+            panes=[session.AgentPane(f"{i:03d}-test", i, "claude", i == 0) for i in range(panes)],
+            tmux_session_name=session_id,
+        )
+
+    def test_summaries_rebuild_missing_index(self) -> None:
+        """Test a missing index is rebuilt from the session files."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            sessions_dir = Path(tmpdir) / "sessions"
+            with patch.object(session, "SESSIONS_DIR", sessions_dir):
+                self._make_session("auto-agent-1").save()
+                self._make_session("auto-agent-2", panes=3).save()
+                (sessions_dir / session.INDEX_FILE).unlink(missing_ok=True)
+
+                summaries = session.list_session_summaries()
+
+                self.assertEqual(
+                    [s.session_id for s in summaries], ["auto-agent-2", "auto-agent-1"]
+                )
+                self.assertEqual(summaries[0].pane_count, 3)
+                # The index is written compact; only session files are indented
+                self.assertNotIn(b"\n", (sessions_dir / session.INDEX_FILE).read_bytes())
+                # The index itself is never listed as a session
+                self.assertEqual(len(session.list_sessions()), 2)
+
+    def test_summaries_rebuild_skips_pane_objects(self) -> None:
+        """Test rebuilding the index counts panes without building AgentPane objects."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            sessions_dir = Path(tmpdir) / "sessions"
+            with patch.object(session, "SESSIONS_DIR", sessions_dir):
+                self._make_session("auto-agent-1", panes=4).save()
+                (sessions_dir / "auto-agent-0.json").write_text('{"panes": []}')
+                (sessions_dir / session.INDEX_FILE).unlink(missing_ok=True)
+
+                with patch.object(session, "AgentPane", side_effect=AssertionError):
+                    summaries = session.list_session_summaries()
+
+                self.assertEqual([s.session_id for s in summaries], ["auto-agent-1"])
+                self.assertEqual(summaries[0].pane_count, 4)
+
+    def test_summaries_follow_save_and_delete(self) -> None:
+        """Test save/delete keep the index current without a rebuild."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            sessions_dir = Path(tmpdir) / "sessions"
+            with patch.object(session, "SESSIONS_DIR", sessions_dir):
+                first = self._make_session("auto-agent-1")
+                first.save()
+                session.list_session_summaries()  # builds the index
+
+                second = self._make_session("auto-agent-2")
+                second.save()
+                first.panes.append(session.AgentPane("001-test", 1, "claude", False))
+                first.save()
+
+                with patch.object(session, "_rebuild_index") as mock_rebuild:
+                    summaries = session.list_session_summaries()
+                    mock_rebuild.assert_not_called()
+                self.assertEqual([s.pane_count for s in summaries], [1, 2])
+
+                second.delete()
+                summaries = session.list_session_summaries()
+                self.assertEqual([s.session_id for s in summaries], ["auto-agent-1"])
+
+    def test_most_recent_session_ignores_stale_index(self) -> None:
+        """Test a session missing from the index is still found as the newest."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            sessions_dir = Path(tmpdir) / "sessions"
+            with patch.object(session, "SESSIONS_DIR", sessions_dir):
+                self._make_session("auto-agent-1").save()
+                session.list_session_summaries()  # builds the index
+                # Written without going through save(), so the index lacks it
+                data = self._make_session("auto-agent-2").to_dict()
+                (sessions_dir / "auto-agent-2.json").write_text(json.dumps(data))
+
+                recent = session.get_most_recent_session()
+                assert recent is not None
+                self.assertEqual(recent.session_id, "auto-agent-2")
+
+    def test_summaries_rebuild_mismatched_entries(self) -> None:
+        """Test index entries with missing or extra keys trigger a rebuild."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            sessions_dir = Path(tmpdir) / "sessions"
+            with patch.object(session, "SESSIONS_DIR", sessions_dir):
+                self._make_session("auto-agent-1", panes=2).save()
+                self._make_session("auto-agent-2").save()
+                session.list_session_summaries()  # builds the index
+                index_file = sessions_dir / session.INDEX_FILE
+                index = json.loads(index_file.read_bytes())
+                index["auto-agent-1"]["branch"] = "main"
+                del index["auto-agent-2"]["pane_count"]
+                index_file.write_text(json.dumps(index))
+
+                summaries = session.list_session_summaries()
+
+                self.assertEqual([s.pane_count for s in summaries], [1, 2])
+                rebuilt = json.loads(index_file.read_bytes())
+                self.assertNotIn("branch", rebuilt["auto-agent-1"])
+
+    def test_summaries_rebuild_scans_under_lock(self) -> None:
+        """Test the rebuild lists session files while holding the sessions lock."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            sessions_dir = Path(tmpdir) / "sessions"
+            with patch.object(session, "SESSIONS_DIR", sessions_dir):
+                self._make_session("auto-agent-1").save()  # no index yet
+                lock_file = sessions_dir / session.SESSIONS_LOCK_FILE
+                locked: list[bool] = []
+                real_session_ids = session._session_ids  # pyright: ignore[reportPrivateUsage]
+
+                def session_ids() -> list[str]:
+                    with open(lock_file, "w") as f:
+                        try:
+                            fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                            locked.append(False)
+                        except BlockingIOError:
+                            locked.append(True)
+                    return real_session_ids()
+
+                with patch.object(session, "_session_ids", side_effect=session_ids):
+                    summaries = session.list_session_summaries()
+
+                self.assertEqual([s.session_id for s in summaries], ["auto-agent-1"])
+                self.assertEqual(locked, [False, True])
+
+    def test_summaries_heal_stale_index(self) -> None:
+        """Test an index referencing a removed file is rebuilt."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            sessions_dir = Path(tmpdir) / "sessions"
+            with patch.object(session, "SESSIONS_DIR", sessions_dir):
+                self._make_session("auto-agent-1").save()
+                self._make_session("auto-agent-2").save()
+                session.list_session_summaries()
+                (sessions_dir / "auto-agent-2.json").unlink()
+
+                summaries = session.list_session_summaries()
+
+                self.assertEqual([s.session_id for s in summaries], ["auto-agent-1"])
+
+
 class TestFindPaneByTarget(unittest.TestCase):
     """Test pane finding functionality."""
 
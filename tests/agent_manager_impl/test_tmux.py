@@ -7,6 +7,7 @@ Tests the tmux.py module functionality. tmux commands are mocked.
 
 import subprocess
 import unittest
+from pathlib import Path
 from unittest.mock import Mock, patch
 
 from lsimons_auto.actions.agent_manager_impl import tmux
@@ -25,9 +26,33 @@ class TestTmuxHelpers(unittest.TestCase):
         self.assertEqual(result, "output")
         mock_run.assert_called_once()
         args = mock_run.call_args[0][0]
-        self.assertEqual(args[0], "tmux")
+        self.assertEqual(args[0], tmux.tmux_binary())
         self.assertEqual(args[1], "list-sessions")
 
+    def test_tmux_binary_resolved_once(self) -> None:
+        """Test the tmux path is looked up once and falls back to the bare name."""
+        tmux.tmux_binary.cache_clear()
+        self.addCleanup(tmux.tmux_binary.cache_clear)
+        with patch.object(tmux.shutil, "which", return_value="/opt/bin/tmux") as mock_which:
+            self.assertEqual(tmux.tmux_binary(), "/opt/bin/tmux")
+            self.assertEqual(tmux.tmux_binary(), "/opt/bin/tmux")
+            mock_which.assert_called_once_with("tmux")
+
+        tmux.tmux_binary.cache_clear()
+        with patch.object(tmux.shutil, "which", return_value=None):
+            self.assertEqual(tmux.tmux_binary(), "tmux")
+
+    @patch.object(tmux.subprocess, "run")
+    def test_run_tmux_without_capture(self, mock_run: Mock) -> None:
+        """Test output-less commands send stdout to /dev/null but keep stderr."""
+        mock_run.return_value = Mock(stdout=None, stderr="")
+
+        self.assertEqual(tmux.run_tmux("select-pane", "-t", "%1", capture=False), "")
+
+        kwargs = mock_run.call_args[1]
+        self.assertEqual(kwargs["stdout"], subprocess.DEVNULL)
+        self.assertEqual(kwargs["stderr"], subprocess.PIPE)
+
     @patch.object(tmux.subprocess, "run")
     def test_run_tmux_failure(self, mock_run: Mock) -> None:
         """Test tmux command failure handling."""
@@ -54,7 +79,9 @@ class TestTmuxHelpers(unittest.TestCase):
         result = tmux.session_exists("test-session")
 
         self.assertTrue(result)
-        mock_run.assert_called_once_with("has-session", "-t", "test-session", check=True)
+        mock_run.assert_called_once_with(
+            "has-session", "-t", "test-session", check=True, capture=False
+        )
 
     @patch.object(tmux, "run_tmux")
     def test_session_exists_false(self, mock_run: Mock) -> None:
@@ -65,6 +92,23 @@ class TestTmuxHelpers(unittest.TestCase):
 
         self.assertFalse(result)
 
+    @patch.object(tmux, "run_tmux")
+    def test_list_tmux_sessions(self, mock_run: Mock) -> None:
+        """Test list_tmux_sessions returns all session names from one call."""
+        mock_run.return_value = "auto-agent-1\nauto-agent-2"
+
+        self.assertEqual(tmux.list_tmux_sessions(), {"auto-agent-1", "auto-agent-2"})
+        mock_run.assert_called_once_with("list-sessions", "-F", "#{session_name}", check=False)
+
+    @patch.object(tmux, "run_tmux")
+    def test_list_tmux_sessions_no_server(self, mock_run: Mock) -> None:
+        """Test list_tmux_sessions is empty without a server or tmux binary."""
+        mock_run.return_value = ""
+        self.assertEqual(tmux.list_tmux_sessions(), set())
+
+        mock_run.side_effect = RuntimeError("tmux not found")
+        self.assertEqual(tmux.list_tmux_sessions(), set())
+
     @patch.object(tmux, "run_tmux")
     def test_send_keys_with_enter(self, mock_run: Mock) -> None:
         """Test send_keys with Enter key."""
@@ -72,7 +116,7 @@ class TestTmuxHelpers(unittest.TestCase):
 
         tmux.send_keys("%0", "ls -la", enter=True)
 
-        mock_run.assert_called_once_with("send-keys", "-t", "%0", "ls -la", "Enter")
+        mock_run.assert_called_once_with("send-keys", "-t", "%0", "ls -la", "Enter", capture=False)
 
     @patch.object(tmux, "run_tmux")
     def test_send_keys_without_enter(self, mock_run: Mock) -> None:
@@ -81,7 +125,50 @@ class TestTmuxHelpers(unittest.TestCase):
 
         tmux.send_keys("%0", "partial text", enter=False)
 
-        mock_run.assert_called_once_with("send-keys", "-t", "%0", "partial text")
+        mock_run.assert_called_once_with("send-keys", "-t", "%0", "partial text", capture=False)
+
+    @patch.object(tmux, "run_tmux")
+    def test_send_keys_escapes_trailing_semicolon(self, mock_run: Mock) -> None:
+        """Test a trailing ';' is not taken as a tmux command separator."""
+        tmux.send_keys("%0", "echo hi;", enter=False)
+
+        mock_run.assert_called_once_with("send-keys", "-t", "%0", "echo hi\\;", capture=False)
+
+    @patch.object(tmux, "run_tmux")
+    def test_send_keys_multi_single_call(self, mock_run: Mock) -> None:
+        """Test sending to several panes chains send-keys in one tmux call."""
+        tmux.send_keys_multi(["%0", "%1"], "ls")
+
+        mock_run.assert_called_once_with(
+            "send-keys",
+            "-t",
+            "%0",
+            "ls",
+            "Enter",
+            ";",
+            "send-keys",
+            "-t",
+            "%1",
+            "ls",
+            "Enter",
+            capture=False,
+        )
+
+    @patch.object(tmux, "run_tmux")
+    def test_send_keys_multi_no_panes(self, mock_run: Mock) -> None:
+        """Test sending to no panes runs nothing."""
+        tmux.send_keys_multi([], "ls")
+
+        mock_run.assert_not_called()
+
+    @patch.object(tmux, "run_tmux", return_value="%3")
+    def test_create_session_single_call(self, mock_run: Mock) -> None:
+        """Test create_session takes the pane id from new-session's -P output."""
+        self.assertEqual(tmux.create_session("s", Path("/repo")), "%3")
+
+        mock_run.assert_called_once_with(
+            "new-session", "-d", "-s", "s", "-c", "/repo", "-P", "-F", "#{pane_id}"
+        )
 
     @patch.object(tmux, "run_tmux")
     def test_select_pane(self, mock_run: Mock) -> None:
@@ -90,7 +177,7 @@ class TestTmuxHelpers(unittest.TestCase):
 
         tmux.select_pane("%1")
 
-        mock_run.assert_called_once_with("select-pane", "-t", "%1")
+        mock_run.assert_called_once_with("select-pane", "-t", "%1", capture=False)
 
     @patch.object(tmux, "run_tmux")
     def test_kill_pane(self, mock_run: Mock) -> None:
@@ -99,7 +186,7 @@ class TestTmuxHelpers(unittest.TestCase):
 
         tmux.kill_pane("%2")
 
-        mock_run.assert_called_once_with("kill-pane", "-t", "%2")
+        mock_run.assert_called_once_with("kill-pane", "-t", "%2", capture=False)
 
     @patch.object(tmux, "run_tmux")
     def test_kill_session(self, mock_run: Mock) -> None:
@@ -108,7 +195,7 @@ class TestTmuxHelpers(unittest.TestCase):
 
         tmux.kill_session("test-session")
 
-        mock_run.assert_called_once_with("kill-session", "-t", "test-session")
+        mock_run.assert_called_once_with("kill-session", "-t", "test-session", capture=False)
 
     @patch.object(tmux, "run_tmux")
     def test_list_panes(self, mock_run: Mock) -> None:
@@ -135,16 +222,16 @@ class TestTmuxHelpers(unittest.TestCase):
         mock_run.return_value = ""
 
         tmux.focus_pane_direction("test-session", "left")
-        mock_run.assert_called_with("select-pane", "-t", "test-session", "-L")
+        mock_run.assert_called_with("select-pane", "-t", "test-session", "-L", capture=False)
 
         tmux.focus_pane_direction("test-session", "right")
-        mock_run.assert_called_with("select-pane", "-t", "test-session", "-R")
+        mock_run.assert_called_with("select-pane", "-t", "test-session", "-R", capture=False)
 
         tmux.focus_pane_direction("test-session", "up")
-        mock_run.assert_called_with("select-pane", "-t", "test-session", "-U")
+        mock_run.assert_called_with("select-pane", "-t", "test-session", "-U", capture=False)
 
         tmux.focus_pane_direction("test-session", "down")
-        mock_run.assert_called_with("select-pane", "-t", "test-session", "-D")
+        mock_run.assert_called_with("select-pane", "-t", "test-session", "-D", capture=False)
 
     def test_is_inside_tmux_false(self) -> None:
         """Test is_inside_tmux when not in tmux."""
@@ -158,6 +245,16 @@ class TestTmuxHelpers(unittest.TestCase):
             result = tmux.is_inside_tmux()
             self.assertTrue(result)
 
+    @patch.object(tmux, "run_tmux", return_value="auto-agent-1")
+    def test_get_current_session(self, mock_run: Mock) -> None:
+        """Test the current session is asked from tmux only when inside tmux."""
+        with patch.dict("os.environ", {"TMUX": "/tmp/tmux-1000/default,12345,0"}):
+            self.assertEqual(tmux.get_current_session(), "auto-agent-1")
+        mock_run.assert_called_once_with("display-message", "-p", "#{session_name}")
+
+        with patch.dict("os.environ", {}, clear=True):
+            self.assertIsNone(tmux.get_current_session())
+        mock_run.assert_called_once()
 
 if __name__ == "__main__":
     unittest.main()
@@ -145,6 +145,18 @@ class TestFuzzyMatching(unittest.TestCase):
             workspace.fuzzy_match_workspace("lsimons", "nonexistent", workspaces)
         self.assertIn("No repo found", str(cm.exception))
 
+    def test_fuzzy_match_mixed_case(self) -> None:
+        """Test org and repo names with capitals match lowercase and uppercase queries."""
+        workspaces = {
+            "Lsimons": {"Lsimons-Auto": Path("/a"), "tools": Path("/b")},
+            "other": {"repo": Path("/c")},
+        }
+
+        result = workspace.fuzzy_match_workspace("LSIM", "auto", workspaces)
+        self.assertEqual(result, ("Lsimons", "Lsimons-Auto", Path("/a")))
+        result = workspace.fuzzy_match_workspace("oth", "REP", workspaces)
+        self.assertEqual(result, ("other", "repo", Path("/c")))
+
 
 if __name__ == "__main__":
     unittest.main()
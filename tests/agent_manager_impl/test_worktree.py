@@ -5,9 +5,11 @@ Tests for git worktree management.
 Tests the worktree.py module functionality.
 """
 
+import subprocess
 import tempfile
 import unittest
 from pathlib import Path
+from unittest.mock import Mock, patch
 
 from lsimons_auto.actions.agent_manager_impl import worktree
 
@@ -40,6 +42,74 @@ class TestWorktreeFunctions(unittest.TestCase):
             self.assertEqual(worktrees_dir1, worktrees_dir2)
             self.assertTrue(worktrees_dir2.exists())
 
+    @patch.object(worktree.time, "sleep")
+    @patch.object(worktree.subprocess, "run")
+    def test_ensure_worktree_retries_on_lock(self, mock_run: Mock, mock_sleep: Mock) -> None:
+        """Test a git lock collision is retried instead of failing."""
+        lock_error = subprocess.CalledProcessError(
+            128, "git", stderr="fatal: Unable to create '.git/config.lock': File exists."
+        )
+        mock_run.side_effect = [lock_error, Mock(returncode=1), Mock()]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = worktree.ensure_worktree(Path(tmpdir), "001", Path(tmpdir) / "wt")
+
+        self.assertEqual(path, Path(tmpdir) / "wt" / "001")
+        self.assertEqual(mock_run.call_count, 3)
+        mock_sleep.assert_called_once()
+        self.assertEqual(mock_run.call_args[0][0][3], "-b")
+
+    @patch.object(worktree.time, "sleep")
+    @patch.object(worktree.subprocess, "run")
+    def test_ensure_worktree_retry_reuses_created_branch(
+        self, mock_run: Mock, _mock_sleep: Mock
+    ) -> None:
+        """Test a retry checks out the branch a failed attempt already created."""
+        lock_error = subprocess.CalledProcessError(
+            128, "git", stderr="fatal: Unable to create '.git/index.lock': File exists."
+        )
+        mock_run.side_effect = [lock_error, Mock(returncode=0), Mock()]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            worktree.ensure_worktree(Path(tmpdir), "001", Path(tmpdir) / "wt")
+
+        first_add = mock_run.call_args_list[0][0][0]
+        self.assertEqual(first_add[3], "-b")
+        retry_add = mock_run.call_args[0][0]
+        self.assertNotIn("-b", retry_add)
+        self.assertEqual(retry_add[3:], [str(Path(tmpdir) / "wt" / "001"), first_add[4]])
+
+    @patch.object(worktree.subprocess, "run")
+    def test_ensure_worktree_other_error_not_retried(self, mock_run: Mock) -> None:
+        """Test non-lock git errors fail immediately."""
+        mock_run.side_effect = subprocess.CalledProcessError(128, "git", stderr="fatal: bad")
+        with tempfile.TemporaryDirectory() as tmpdir, self.assertRaises(RuntimeError):
+            worktree.ensure_worktree(Path(tmpdir), "001", Path(tmpdir) / "wt")
+        mock_run.assert_called_once()
+
+    @patch.object(worktree.subprocess, "run")
+    def test_ensure_worktree_replaces_stale_directory(self, mock_run: Mock) -> None:
+        """Test a leftover non-worktree directory is removed and pruned before adding."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            stale = Path(tmpdir) / "wt" / "001"
+            stale.mkdir(parents=True)
+            (stale / "leftover.txt").write_text("x")
+
+            worktree.ensure_worktree(Path(tmpdir), "001", Path(tmpdir) / "wt")
+
+            self.assertFalse((stale / "leftover.txt").exists())
+        commands = [c[0][0][:3] for c in mock_run.call_args_list]
+        self.assertEqual(commands, [["git", "worktree", "prune"], ["git", "worktree", "add"]])
+
+    @patch.object(worktree.subprocess, "run")
+    def test_ensure_worktrees_creates_all(self, mock_run: Mock) -> None:
+        """Test ensure_worktrees creates every named worktree, keyed by name."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            worktrees_dir = Path(tmpdir) / "wt"
+            paths = worktree.ensure_worktrees(Path(tmpdir), ["M", "001", "002"], worktrees_dir)
+
+        self.assertEqual(list(paths), ["M", "001", "002"])
+        self.assertEqual(paths["001"], worktrees_dir / "001")
+        self.assertEqual(mock_run.call_count, 3)
+
 
 if __name__ == "__main__":
     unittest.main()
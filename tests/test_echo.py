@@ -50,3 +50,12 @@ class TestEcho:
         """Test default message with uppercase."""
         main(["--upper"])
         assert mock_stdout.getvalue().strip() == "HELLO, WORLD!"
+
+    @patch("sys.stdout", new_callable=StringIO)
+    def test_echo_reads_sys_argv(self, mock_stdout: StringIO) -> None:
+        """Test echo falls back to sys.argv, with and without options."""
+        with patch("sys.argv", ["echo.py", "from", "argv"]):
+            main()
+        with patch("sys.argv", ["echo.py", "loud", "--upper"]):
+            main()
+        assert mock_stdout.getvalue().splitlines() == ["from argv", "LOUD"]
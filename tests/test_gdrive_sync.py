@@ -76,8 +76,34 @@ class TestGdriveSync(unittest.TestCase):
             self.assertEqual(args[1], "sync")
             self.assertEqual(args[3], "/Volumes/LSData/Google Drive")
 
+            self.assertIn("--fast-list", args)
+            self.assertEqual(args[args.index("--transfers") + 1], "16")
+            self.assertEqual(args[args.index("--checkers") + 1], "32")
+
             mock_print.assert_any_call("Sync completed successfully.")
 
+    @patch("socket.gethostname")
+    @patch("os.path.ismount")
+    @patch("os.path.exists")
+    @patch("subprocess.run")
+    def test_sync_parallelism_flags(
+        self,
+        mock_run: MagicMock,
+        mock_exists: MagicMock,
+        mock_ismount: MagicMock,
+        mock_hostname: MagicMock,
+    ) -> None:
+        mock_hostname.return_value = "paddo"
+        mock_ismount.return_value = True
+        mock_exists.return_value = True
+
+        with patch("builtins.print"):
+            main(["--transfers", "4", "--checkers", "8"])
+
+        args = mock_run.call_args[0][0]
+        self.assertEqual(args[args.index("--transfers") + 1], "4")
+        self.assertEqual(args[args.index("--checkers") + 1], "8")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -2,6 +2,8 @@
 
 import json
 import subprocess
+import sys
+import threading
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -14,12 +16,17 @@ from lsimons_auto.actions.git_sync import (
     build_bot_remote_context,
     build_fork_context,
     configure_bot_remote,
+    fetched_within,
     filter_repos_by_allowlist,
     get_authenticated_user,
     get_command_output,
+    get_repo_lists,
     get_repos,
     get_user_forks,
+    preview_remote_config,
     run_command,
+    run_jobs,
+    sync_repo,
     try_fast_forward,
 )
 
@@ -242,12 +249,15 @@ class TestRunCommand:
         assert result is True
 
     @patch("subprocess.run")
-    def test_run_command_failure(self, mock_run: MagicMock) -> None:
-        """Test failed command execution."""
-        mock_run.side_effect = subprocess.CalledProcessError(1, ["false"], output="error output")
+    def test_run_command_failure(
+        self, mock_run: MagicMock, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test failed command execution decodes the captured bytes."""
+        mock_run.side_effect = subprocess.CalledProcessError(1, ["false"], output=b"error output\n")
 
         result = run_command(["false"])
         assert result is False
+        assert "error output" in capsys.readouterr().out
 
     @patch("subprocess.run")
     def test_run_command_with_cwd(self, mock_run: MagicMock) -> None:
@@ -259,6 +269,7 @@ class TestRunCommand:
 
         run_command(["pwd"], cwd=test_path)
         assert mock_run.call_args[1]["cwd"] == test_path
+        assert "text" not in mock_run.call_args[1]
 
 
 class TestGetRepos:
@@ -267,37 +278,41 @@ class TestGetRepos:
     @patch("subprocess.run")
     def test_get_repos_success(self, mock_run: MagicMock) -> None:
         """Test successful repository fetching."""
-        repos_data = [
-            {"name": "repo1", "isFork": False, "isArchived": False},
-            {"name": "repo2", "isFork": True, "isArchived": False},
-            {"name": "repo3", "isFork": False, "isArchived": True},
-            {"name": "repo4", "isFork": False, "isArchived": False},
-        ]
+        # Forks are already filtered out by the --jq expression
         mock_run.return_value = subprocess.CompletedProcess(
-            args=[], returncode=0, stdout=json.dumps(repos_data), stderr=""
+            args=[], returncode=0, stdout="repo1\tfalse\nrepo3\ttrue\nrepo4\tfalse\n", stderr=""
         )
 
         result = get_repos("testowner")
         assert "repo1" in result
         assert "repo4" in result
-        assert "repo2" not in result  # Fork excluded
         assert "repo3" not in result  # Archived excluded
+        cmd = mock_run.call_args[0][0]
+        assert "select(.isFork | not)" in cmd[cmd.index("--jq") + 1]
 
     @patch("subprocess.run")
     def test_get_repos_archived(self, mock_run: MagicMock) -> None:
         """Test fetching archived repositories."""
-        repos_data = [
-            {"name": "repo1", "isFork": False, "isArchived": False},
-            {"name": "repo3", "isFork": False, "isArchived": True},
-        ]
         mock_run.return_value = subprocess.CompletedProcess(
-            args=[], returncode=0, stdout=json.dumps(repos_data), stderr=""
+            args=[], returncode=0, stdout="repo1\tfalse\nrepo3\ttrue\n", stderr=""
         )
 
         result = get_repos("testowner", archive=True)
         assert "repo3" in result
         assert "repo1" not in result
 
+    @patch("subprocess.run")
+    def test_get_repo_lists_single_call(self, mock_run: MagicMock) -> None:
+        """Test active and archived repos come from one gh call."""
+        mock_run.return_value = subprocess.CompletedProcess(
+            args=[], returncode=0, stdout="repo1\tfalse\nrepo3\ttrue\n", stderr=""
+        )
+
+        result = get_repo_lists("testowner")
+        assert result.active == ["repo1"]
+        assert result.archived == ["repo3"]
+        mock_run.assert_called_once()
+
     @patch("subprocess.run")
     def test_get_repos_gh_not_found(self, mock_run: MagicMock) -> None:
         """Test error handling when gh CLI not found."""
@@ -317,10 +332,10 @@ class TestGetRepos:
         assert exc_info.value.code == 1
 
     @patch("subprocess.run")
-    def test_get_repos_json_error(self, mock_run: MagicMock) -> None:
-        """Test error handling when JSON parsing fails."""
+    def test_get_repos_parse_error(self, mock_run: MagicMock) -> None:
+        """Test error handling when gh output isn't name/archived lines."""
         mock_run.return_value = subprocess.CompletedProcess(
-            args=[], returncode=0, stdout="invalid json", stderr=""
+            args=[], returncode=0, stdout="invalid output", stderr=""
         )
 
         with pytest.raises(SystemExit) as exc_info:
@@ -550,3 +565,90 @@ class TestConfigureBotRemote:
         assert result is True
         # Should be called once to fetch (no add/update needed)
         mock_run_cmd.assert_called_once()
+
+
+class TestRunJobs:
+    """Test run_jobs function."""
+
+    def test_run_jobs_keeps_each_jobs_output_together(
+        self, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test concurrent jobs print their lines as contiguous blocks."""
+        barrier = threading.Barrier(3)
+
+        def job(name: str) -> None:
+            print(f"{name} start")
+            barrier.wait(timeout=5)  # all three jobs are running at once here
+            print(f"{name} end")
+
+        stdout = sys.stdout
+        run_jobs([lambda n=n: job(n) for n in ("a", "b", "c")], max_workers=3)
+
+        assert sys.stdout is stdout
+        lines = capsys.readouterr().out.splitlines()
+        assert sorted(lines) == ["a end", "a start", "b end", "b start", "c end", "c start"]
+        for i in range(0, 6, 2):
+            assert lines[i].split()[0] == lines[i + 1].split()[0]
+
+    def test_run_jobs_serial(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Test a single worker runs jobs in order on the calling thread."""
+        run_jobs([lambda: print("first"), lambda: print("second")], max_workers=1)
+
+        assert capsys.readouterr().out == "first\nsecond\n"
+
+    def test_run_jobs_propagates_errors(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Test a failing job raises after its output has been printed."""
+
+        def failing() -> None:
+            print("about to fail")
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            run_jobs([failing, lambda: None], max_workers=2)
+        assert "about to fail" in capsys.readouterr().out
+
+
+class TestMinInterval:
+    """Test skipping recently fetched repositories."""
+
+    def test_fetched_within(self, tmp_path: Path) -> None:
+        """Test FETCH_HEAD age decides whether a repo counts as recently fetched."""
+        (tmp_path / ".git").mkdir()
+        assert fetched_within(tmp_path, 600) is False  # never fetched
+
+        (tmp_path / ".git" / "FETCH_HEAD").write_text("")
+        assert fetched_within(tmp_path, 600) is True
+        assert fetched_within(tmp_path, 0) is False  # disabled by default
+
+    @patch("lsimons_auto.actions.git_sync.run_command")
+    def test_sync_repo_skips_recent_fetch(self, mock_run_cmd: MagicMock, tmp_path: Path) -> None:
+        """Test sync_repo runs no git commands for a repo fetched recently."""
+        repo_git = tmp_path / "repo" / ".git"
+        repo_git.mkdir(parents=True)
+        (repo_git / "FETCH_HEAD").write_text("")
+
+        assert sync_repo("owner", "repo", tmp_path, min_interval=600) is True
+        mock_run_cmd.assert_not_called()
+
+
+class TestPreviewRemoteConfig:
+    """Test preview_remote_config function."""
+
+    def test_preview_fork_remotes(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+        """Test dry-run output for an existing repo with a fork."""
+        (tmp_path / "repo").mkdir()
+        fork_context = ForkContext("lsimons-bot", {"owner/repo": "https://github.com/bot/repo"})
+
+        preview_remote_config("owner", "repo", tmp_path, fork_context, None)
+
+        out = capsys.readouterr().out
+        assert "Would reconfigure remotes for repo:" in out
+        assert "upstream -> https://github.com/owner/repo.git" in out
+
+    def test_preview_missing_repo(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+        """Test nothing is printed for a repo that hasn't been cloned yet."""
+        fork_context = ForkContext("lsimons-bot", {"owner/repo": "https://github.com/bot/repo"})
+
+        preview_remote_config("owner", "repo", tmp_path, fork_context, None)
+
+        assert capsys.readouterr().out == ""